@@ -1,20 +1,76 @@
 """The Logger Manager integration."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from datetime import datetime, timedelta
 import logging
 import time
 import voluptuous as vol
-import fnmatch
 import hashlib, json
 
 from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.messages import construct_result_message
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers.storage import Store
-
-from .const import CONF_FILTER_PATTERNS, DEFAULT_FILTER_PATTERNS
+from homeassistant.const import (
+    EVENT_CALL_SERVICE,
+    EVENT_COMPONENT_LOADED,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    Platform,
+)
+from homeassistant.core import (
+    CoreState,
+    Event,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+import homeassistant.helpers.config_validation as cv
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from .const import (
+    CONF_CRITICAL_LOGGERS,
+    CONF_DISCOVERY_SLICE_MS,
+    CONF_FILTER_PATTERNS,
+    CONF_RESTORE_MODE,
+    CONF_SAVE_DELAY,
+    CONF_VOLUME_TRACKING,
+    DEFAULT_DISCOVERY_SLICE_MS,
+    DEFAULT_FILTER_PATTERNS,
+    DEFAULT_RESTORE_MODE,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_VOLUME_TRACKING,
+    RESTORE_MODE_DEFERRED,
+    SIGNAL_LEVELS_UPDATED,
+    SIGNAL_LOGGERS_UPDATED,
+)
+from .discovery import DiscoveryIndex
+from .effective import EffectiveLevelCache
+from .journal import (
+    JOURNAL_COMPACT_EVERY,
+    JOURNAL_FILENAME,
+    SOURCE_CLEANUP,
+    SOURCE_EXPIRY,
+    SOURCE_RESTORE,
+    SOURCE_SERVICE,
+    ChangeJournal,
+)
+from .levels import LevelApplier, managed_digest
+from .matcher import LoggerMatcher, is_literal
+from .metrics import Metrics
+from .profiler import PROFILE_MAX_LOGGERS, LoggingProfiler
+from .scheduler import ExpiryScheduler
+from .search import SEARCH_MODES, LoggerSearchIndex
+from .throttle import ThrottleManager
+from .tree import ROOT as TREE_ROOT, LoggerTree
+from .volume import VOLUME_TOP_N, LogVolumeHandler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,67 +80,147 @@ STORAGE_VERSION = 1
 STORAGE_KEY = "logger_manager_state"
 
 # Cache configuration
-CACHE_TTL = 1800  # 30 minutes
+CACHE_TTL = 1800  # 30 minutes; safety net only, freshness is tracked by the discovery index
 CACHE_KEY = "logger_cache"
+MATCHER_KEY = "matcher"
+INDEX_KEY = "discovery_index"
+VERSION_KEY = "cache_version"
+METRICS_KEY = "metrics"
+DISCOVERY_TASK_KEY = "discovery_task"
+DISCOVERY_STORAGE_KEY = "logger_manager_discovery"
+DISCOVERY_SAVE_DELAY = 30  # seconds; discovery changes in bursts while integrations load
+# Where a cached logger list came from
+SOURCE_DISK = "disk"  # loaded from storage at setup, not yet revalidated
+SOURCE_WARM = "warm"  # refreshed in the background
+SOURCE_FRESH = "fresh"  # discovered to answer a request
+DISCOVERY_DEBOUNCE = 1.0  # seconds to coalesce bursts of component-loaded events
+
+# Search configuration
+SEARCH_DEFAULT_LIMIT = 50
+SEARCH_MAX_LIMIT = 500
 
 # Platforms to set up
 PLATFORMS = [Platform.SENSOR]
 
-SCHEMA = vol.Schema({
-    vol.Required("level"): vol.In(LEVELS),
-    vol.Required("loggers"): [str],
+SCHEMA = vol.All(vol.Schema({
+    vol.Inclusive("level", "single_level"): vol.In(LEVELS),
+    vol.Inclusive("loggers", "single_level"): [str],
+    vol.Optional("levels"): {str: vol.In(LEVELS)},
+    vol.Optional("rate_limit"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    vol.Optional("sample_ratio"): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+    vol.Optional("duration"): cv.positive_time_period,
+}), cv.has_at_least_one_key("loggers", "levels"))
+
+PROFILE_SCHEMA = vol.Schema({
+    vol.Required("enabled"): bool,
+    vol.Optional("loggers", default=[]): vol.All([str], vol.Length(max=PROFILE_MAX_LOGGERS)),
 })
 
 # Test schema (no parameters needed)
 TEST_SCHEMA = vol.Schema({})
 
-def _effective_filtered_loggers(all_loggers: list[str], entry) -> list[str]:
+def _effective_filtered_loggers(all_loggers: list[str], matcher: LoggerMatcher) -> list[str]:
     """Return sorted unique logger names matched by built-in + user patterns (glob)."""
-    extras = entry.options.get(CONF_FILTER_PATTERNS, [])
-    # order-preserving de-dupe of patterns
-    seen = set()
-    patterns: list[str] = []
-    for p in DEFAULT_FILTER_PATTERNS + extras:
-        if p and p not in seen:
-            seen.add(p)
-            patterns.append(p)
+    # You already block "*" in the options flow; no need to re-check here
+    return sorted(set(matcher.filter(all_loggers)))
 
-    matched: set[str] = set()
 
-    # exact matches first (fast path)
-    for p in patterns:
-        if p in all_loggers:
-            matched.add(p)
-
-    # glob matches
-    for p in patterns:
-        # You already block "*" in the options flow; no need to re-check here
-        for name in all_loggers:
-            if fnmatch.fnmatch(name, p):
-                matched.add(name)
+def _get_matcher(hass: HomeAssistant) -> LoggerMatcher:
+    """Return the compiled matcher for the current patterns, rebuilding it only when they change."""
+    patterns = _current_patterns(hass)
+    fp = _patterns_fp(patterns)
+    matcher = hass.data[DOMAIN].get(MATCHER_KEY)
+    if matcher is None or matcher.fingerprint != fp:
+        matcher = LoggerMatcher(patterns, fp)
+        hass.data[DOMAIN][MATCHER_KEY] = matcher
+        _LOGGER.debug(f"Compiled logger matcher for {len(patterns)} patterns")
+    return matcher
+
+
+def _get_discovery_index(hass: HomeAssistant) -> DiscoveryIndex:
+    """Return the discovery index for the current patterns, starting a new one when they change."""
+    matcher = _get_matcher(hass)
+    index = hass.data[DOMAIN].get(INDEX_KEY)
+    if index is None or index.matcher is not matcher:
+        index = DiscoveryIndex(matcher, previous=index.loggers if index else None)
+        hass.data[DOMAIN][INDEX_KEY] = index
+    return index
+
+
+def _get_metrics(hass: HomeAssistant) -> Metrics:
+    """Return the integration's metrics, creating them on first use."""
+    managed_data = hass.data.setdefault(DOMAIN, {})
+    metrics = managed_data.get(METRICS_KEY)
+    if metrics is None:
+        metrics = managed_data[METRICS_KEY] = Metrics()
+    return metrics
+
+
+async def _async_refresh_index(
+    hass: HomeAssistant, index: DiscoveryIndex, logger_dict: dict
+) -> tuple[list[str], list[str], int, int]:
+    """Refresh the discovery index in time-boxed slices, yielding to the loop between them.
+
+    Returns the added and removed names, the number of slices and the
+    longest slice in nanoseconds (the longest the event loop was blocked).
+    """
+    entry = hass.data[DOMAIN].get("entry")
+    slice_ms = DEFAULT_DISCOVERY_SLICE_MS
+    if entry and entry.options:
+        slice_ms = entry.options.get(CONF_DISCOVERY_SLICE_MS, DEFAULT_DISCOVERY_SLICE_MS)
 
-    return sorted(matched)
+    metrics = _get_metrics(hass)
+    steps = index.refresh_steps(logger_dict, slice_ms / 1000)
+    slices = longest = 0
+    try:
+        while True:
+            start = time.perf_counter_ns()
+            result = None
+            try:
+                next(steps)
+            except StopIteration as done:
+                result = done.value
+            elapsed = time.perf_counter_ns() - start
+            metrics.observe("discovery_block", elapsed)
+            slices += 1
+            longest = max(longest, elapsed)
+            if result is not None:
+                added, removed = result
+                return added, removed, slices, longest
+            await asyncio.sleep(0)
+    finally:
+        # Cancelled between slices: leave the index as it was
+        steps.close()
 
 
 async def _discover_available_loggers(hass: HomeAssistant) -> list[str]:
     """Discover available loggers from Python logging system.
 
-    Extracts the core discovery logic from the test service for reuse.
+    Only names added to loggerDict since the previous call are matched; the
+    first call (or the first after a pattern change) scans everything. The
+    work runs on a snapshot of the names in slices of at most the configured
+    budget, so large loggerDicts do not stall the event loop.
     Returns a sorted list of relevant logger names.
     """
+    metrics = _get_metrics(hass)
     try:
         logger_dict = logging.Logger.manager.loggerDict
+        index = _get_discovery_index(hass)
+        # A first scan walks all of loggerDict; later ones only the new names
+        with metrics.timer("discovery_full" if index.scanned == 0 else "discovery_incremental"):
+            added, removed, slices, longest = await _async_refresh_index(hass, index, logger_dict)
+        metrics.size("discovery_loggers", len(index.loggers))
 
-        # Get all string logger names
-        all_loggers = [name for name in logger_dict.keys() if isinstance(name, str)]
+        _LOGGER.debug(
+            f"Logger discovery found {len(index.loggers)} relevant loggers from {index.scanned} total "
+            f"({len(added)} new, {len(removed)} removed) in {slices} slice(s), "
+            f"longest {longest / 1e6:.1f} ms"
+        )
 
-        # filter list based on patterns from config entry
-        entry = hass.data[DOMAIN].get("entry")
-        unique_loggers = _effective_filtered_loggers(all_loggers, entry)
+        if added or removed:
+            async_dispatcher_send(hass, SIGNAL_LOGGERS_UPDATED, added, removed)
 
-        _LOGGER.debug(f"Logger discovery found {len(unique_loggers)} relevant loggers from {len(all_loggers)} total")
-
-        return unique_loggers
+        return list(index.loggers)
 
     except Exception as e:
         _LOGGER.error(f"Logger discovery failed: {e}", exc_info=True)
@@ -109,39 +245,97 @@ def _current_patterns(hass) -> list[str]:
             patterns.append(p)
     return patterns
 
-def _get_logger_cache(hass: HomeAssistant) -> dict | None:
-    """Get cached logger data if still valid."""
-    cache_data = hass.data.get(DOMAIN, {}).get(CACHE_KEY)
-    if not cache_data:
-        return None
-
-    # Check if cache is still valid
-    if _is_cache_valid(hass, cache_data):
-        return cache_data
-
-    # Cache expired, remove it
-    if DOMAIN in hass.data and CACHE_KEY in hass.data[DOMAIN]:
-        del hass.data[DOMAIN][CACHE_KEY]
+def _update_logger_cache(hass: HomeAssistant, loggers: list[str], source: str = SOURCE_FRESH) -> None:
+    """Update the logger cache with new data and schedule saving it to disk."""
+    patterns = _current_patterns(hass)
+    
+    index = hass.data.get(DOMAIN, {}).get(INDEX_KEY)
 
-    return None
+    if DOMAIN not in hass.data:
+        hass.data[DOMAIN] = {}
 
+    # The version only moves when the list changes. It starts from the clock
+    # so versions held by clients from before a restart are never reused.
+    previous = hass.data[DOMAIN].get(VERSION_KEY)
+    if previous is None:
+        version = int(time.time())
+    elif previous[1] == loggers:
+        version = previous[0]
+    else:
+        version = previous[0] + 1
+    hass.data[DOMAIN][VERSION_KEY] = (version, loggers)
 
-def _update_logger_cache(hass: HomeAssistant, loggers: list[str]) -> None:
-    """Update the logger cache with new data."""
-    patterns = _current_patterns(hass)
-    
     cache_data = {
         "loggers": loggers,
         "timestamp": time.time(),
         "patterns_fp": _patterns_fp(patterns),
-        "version": 1
+        "generation": index.generation if index else None,
+        "version": version,
+        "source": source,
     }
 
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-
     hass.data[DOMAIN][CACHE_KEY] = cache_data
-    _LOGGER.debug(f"Logger cache updated with {len(loggers)} loggers")
+    _LOGGER.debug(f"Logger cache updated with {len(loggers)} loggers ({source})")
+
+    store = hass.data[DOMAIN].get("discovery_store")
+    if store is not None:
+        store.async_delay_save(lambda: _discovery_snapshot(cache_data), DISCOVERY_SAVE_DELAY)
+
+
+def _discovery_snapshot(cache_data: dict) -> dict:
+    """Return the persisted form of a logger cache entry."""
+    return {
+        "loggers": cache_data["loggers"],
+        "patterns_fp": cache_data["patterns_fp"],
+        "version": cache_data["version"],
+        "discovered": cache_data["timestamp"],
+    }
+
+
+async def _async_load_discovery_cache(hass: HomeAssistant) -> None:
+    """Answer from the last saved discovery until it has been revalidated.
+
+    A saved list is only used if it was made with the current patterns.
+    """
+    store = Store(hass, STORAGE_VERSION, DISCOVERY_STORAGE_KEY)
+    hass.data[DOMAIN]["discovery_store"] = store
+    if CACHE_KEY in hass.data[DOMAIN]:
+        # Reload of the entry; the in-memory cache is newer than the saved one
+        return
+    try:
+        stored = await store.async_load()
+    except Exception as e:
+        _LOGGER.error(f"Failed to load saved logger discovery: {e}")
+        return
+    if not stored or stored.get("patterns_fp") != _patterns_fp(_current_patterns(hass)):
+        _LOGGER.debug("No usable saved logger discovery")
+        return
+
+    loggers = stored["loggers"]
+    hass.data[DOMAIN][VERSION_KEY] = (stored["version"], loggers)
+    # Diff the first discovery against the saved list, so subscribers get a
+    # delta (and vanished loggers are removed) rather than the whole list
+    if INDEX_KEY not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][INDEX_KEY] = DiscoveryIndex(_get_matcher(hass), previous=loggers)
+    hass.data[DOMAIN][CACHE_KEY] = {
+        "loggers": loggers,
+        # TTL counts from the load; the list is revalidated once HA has started
+        "timestamp": time.time(),
+        "patterns_fp": stored["patterns_fp"],
+        "generation": None,
+        "version": stored["version"],
+        "source": SOURCE_DISK,
+    }
+    _LOGGER.debug(f"Loaded {len(loggers)} loggers from the saved discovery")
+
+
+async def _async_revalidate_discovery(hass: HomeAssistant) -> None:
+    """Replace a disk-loaded logger list with a full discovery in the background."""
+    cache_data = hass.data[DOMAIN].get(CACHE_KEY)
+    if cache_data is None or cache_data.get("source") != SOURCE_DISK:
+        return
+    cache_data = await asyncio.shield(_async_discover_shared(hass, SOURCE_WARM))
+    _LOGGER.debug(f"Revalidated saved discovery: {len(cache_data['loggers'])} loggers")
 
 
 
@@ -156,10 +350,141 @@ def _is_cache_valid(hass: HomeAssistant, cache_data: dict) -> bool:
 
     # pattern fingerprint
     current_fp = _patterns_fp(_current_patterns(hass))
-    return cache_data["patterns_fp"] == current_fp
+    if cache_data["patterns_fp"] != current_fp:
+        return False
+
+    # A saved list is served as-is until the background revalidation replaces it
+    if cache_data.get("source") == SOURCE_DISK:
+        return True
+
+    # loggerDict growth since the cache was built (new integrations loaded)
+    index = hass.data[DOMAIN].get(INDEX_KEY)
+    if index is None or index.is_stale(logging.Logger.manager.loggerDict):
+        return False
+    return cache_data.get("generation") == index.generation
+
+
+async def _async_refresh_discovery(hass: HomeAssistant) -> None:
+    """Pick up newly created loggers and refresh the cache if the result changed."""
+    cache_data = hass.data[DOMAIN].get(CACHE_KEY)
+    if cache_data and cache_data.get("source") == SOURCE_DISK and hass.state is not CoreState.running:
+        # The saved list is revalidated once Home Assistant has started
+        return
+    index = _get_discovery_index(hass)
+    if not index.is_stale(logging.Logger.manager.loggerDict):
+        return
+    await asyncio.shield(_async_discover_shared(hass, SOURCE_WARM))
+
+
+async def _async_run_discovery(hass: HomeAssistant, source: str) -> dict:
+    """Discover loggers and return the cache entry, replacing it if it is outdated."""
+    loggers = await _discover_available_loggers(hass)
+    cache_data = hass.data[DOMAIN].get(CACHE_KEY)
+    if cache_data is None or cache_data.get("source") == SOURCE_DISK or not _is_cache_valid(hass, cache_data):
+        _update_logger_cache(hass, loggers, source)
+    return hass.data[DOMAIN][CACHE_KEY]
+
+
+def _async_discover_shared(hass: HomeAssistant, source: str = SOURCE_FRESH) -> asyncio.Task:
+    """Return the running discovery task, starting one if none is running.
+
+    Every caller that needs a discovery while one is in flight waits for the
+    same task instead of starting its own. Waiters should wrap the task in
+    ``asyncio.shield`` so a cancelled request does not cancel it for the rest;
+    request paths use ``_async_wait_for_discovery``, which also handles unload.
+    """
+    managed_data = hass.data[DOMAIN]
+    metrics = _get_metrics(hass)
+    task = managed_data.get(DISCOVERY_TASK_KEY)
+    if task is not None and not task.done():
+        metrics.incr("discovery_joined")
+        return task
+    metrics.incr("discovery_runs")
+    task = hass.async_create_background_task(
+        _async_run_discovery(hass, source), "logger_manager discovery"
+    )
+    managed_data[DISCOVERY_TASK_KEY] = task
+    return task
+
+
+async def _async_wait_for_discovery(hass: HomeAssistant) -> dict:
+    """Wait for the shared discovery and return its cache entry.
+
+    Unloading the entry cancels the shared task; waiters then get a
+    HomeAssistantError instead of a CancelledError, so request handlers
+    answer with an error rather than leaving the request unanswered. A
+    cancellation of the waiter itself still propagates.
+    """
+    task = _async_discover_shared(hass)
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        current = asyncio.current_task()
+        if not task.cancelled() or (current is not None and current.cancelling()):
+            raise
+        raise HomeAssistantError("Logger discovery was cancelled") from None
+
+
+async def _async_get_or_discover(hass: HomeAssistant) -> tuple[dict, bool]:
+    """Return the logger cache, discovering loggers first on a miss.
+
+    An outdated entry built with the current patterns is served as-is while
+    a background discovery replaces it (stale-while-revalidate). Only a
+    missing entry, or one built with other patterns, waits for discovery.
+    The second element is True if the cache was served without discovery.
+    """
+    metrics = _get_metrics(hass)
+
+    # Check cache first
+    cache_data = hass.data[DOMAIN].get(CACHE_KEY)
+    if cache_data and _is_cache_valid(hass, cache_data):
+        _LOGGER.debug(f"Returning cached logger data ({cache_data['source']})")
+        metrics.incr(f"cache_hit_{cache_data['source']}")
+        return cache_data, True
+
+    if cache_data and cache_data.get("patterns_fp") == _patterns_fp(_current_patterns(hass)):
+        _LOGGER.debug("Returning stale logger data, revalidating in the background")
+        metrics.incr("cache_stale")
+        _async_discover_shared(hass, SOURCE_WARM)
+        return cache_data, True
+
+    # Cache miss - wait for discovery (shared with any concurrent miss)
+    _LOGGER.debug("Cache miss - discovering loggers")
+    metrics.incr("cache_expired" if cache_data else "cache_miss")
+    cache_data = await _async_wait_for_discovery(hass)
+    return cache_data, False
+
+
+def _get_encoded_loggers(cache_data: dict) -> bytes:
+    """Return the JSON-encoded logger list for a cache entry, encoding it on first use."""
+    encoded = cache_data.get("encoded_loggers")
+    if encoded is None:
+        encoded = json_bytes(cache_data["loggers"])
+        cache_data["encoded_loggers"] = encoded
+    return encoded
+
+
+def _get_search_index(cache_data: dict) -> LoggerSearchIndex:
+    """Return the search index for a cache entry, building it on first use."""
+    index = cache_data.get("search_index")
+    if index is None:
+        index = LoggerSearchIndex(cache_data["loggers"])
+        cache_data["search_index"] = index
+    return index
+
+
+def _get_logger_tree(cache_data: dict) -> LoggerTree:
+    """Return the logger tree for a cache entry, building it on first use."""
+    tree = cache_data.get("tree")
+    if tree is None:
+        tree = LoggerTree(cache_data["loggers"])
+        cache_data["tree"] = tree
+    return tree
+
 
 @websocket_api.websocket_command({
     vol.Required("type"): "logger_manager/get_loggers",
+    vol.Optional("version"): int,
 })
 @websocket_api.require_admin
 @callback
@@ -168,34 +493,40 @@ def websocket_get_loggers(
     connection: websocket_api.ActiveConnection,
     msg: dict,
 ) -> None:
-    """Handle WebSocket request for available loggers."""
+    """Handle WebSocket request for available loggers.
+
+    Clients may send the version they already hold; if it is still current
+    the reply is {"not_modified": true} without the list. Otherwise the
+    pre-encoded list is spliced into the reply, so cache hits never
+    re-serialize it.
+    """
 
     async def _handle_request():
         try:
-            # Check cache first
-            cache_data = _get_logger_cache(hass)
-            if cache_data:
-                _LOGGER.debug("Returning cached logger data")
+            cache_data, cached = await _async_get_or_discover(hass)
+            version = cache_data["version"]
+            cache_age = int(time.time() - cache_data["timestamp"]) if cached else 0
+
+            if msg.get("version") == version:
                 connection.send_message(websocket_api.result_message(msg["id"], {
-                    "loggers": cache_data["loggers"],
-                    "cached": True,
-                    "cache_age": int(time.time() - cache_data["timestamp"])
+                    "not_modified": True,
+                    "version": version,
+                    "cached": cached,
+                    "source": cache_data["source"],
+                    "cache_age": cache_age,
                 }))
                 return
 
-            # Cache miss - discover loggers
-            _LOGGER.debug("Cache miss - discovering loggers")
-            loggers = await _discover_available_loggers(hass)
-
-            # Update cache
-            _update_logger_cache(hass, loggers)
-
-            # Return results
-            connection.send_message(websocket_api.result_message(msg["id"], {
-                "loggers": loggers,
-                "cached": False,
-                "cache_age": 0
-            }))
+            payload = b"".join((
+                b'{"loggers":', _get_encoded_loggers(cache_data),
+                b',"version":', str(version).encode(),
+                b',"cached":', b"true" if cached else b"false",
+                b',"source":"', cache_data["source"].encode(), b'"',
+                b',"cache_age":', str(cache_age).encode(),
+                b"}",
+            ))
+            _get_metrics(hass).size("get_loggers_bytes", len(payload))
+            connection.send_message(construct_result_message(msg["id"], payload))
 
         except Exception as e:
             _LOGGER.error(f"WebSocket logger discovery failed: {e}", exc_info=True)
@@ -209,6 +540,284 @@ def websocket_get_loggers(
     hass.async_create_task(_handle_request())
 
 
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/search_loggers",
+    vol.Optional("query", default=""): str,
+    vol.Optional("mode", default="substring"): vol.In(SEARCH_MODES),
+    vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)),
+    vol.Optional("exclude", default=[]): [str],
+})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_search_loggers(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for one page of loggers matching a query."""
+    try:
+        cache_data, _ = await _async_get_or_discover(hass)
+        loggers, total = _get_search_index(cache_data).page(
+            msg["query"],
+            msg["mode"],
+            msg["offset"],
+            msg["limit"],
+            set(msg["exclude"]),
+        )
+        connection.send_result(msg["id"], {
+            "loggers": loggers,
+            "total": total,
+            "offset": msg["offset"],
+            "limit": msg["limit"],
+        })
+
+    except Exception as e:
+        _LOGGER.error(f"WebSocket logger search failed: {e}", exc_info=True)
+        connection.send_error(msg["id"], "search_failed", f"Logger search failed: {str(e)}")
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_logger_tree",
+    vol.Optional("node", default=TREE_ROOT): str,
+    vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_get_logger_tree(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for one level of the logger tree."""
+    try:
+        cache_data, _ = await _async_get_or_discover(hass)
+        tree = _get_logger_tree(cache_data)
+        node = msg["node"]
+        if node not in tree:
+            connection.send_error(msg["id"], "not_found", f"Logger tree node not found: {node}")
+            return
+
+        connection.send_result(msg["id"], {
+            "node": node,
+            "total": tree.child_count(node),
+            "children": tree.children(node, msg["offset"], msg.get("limit")),
+        })
+
+    except Exception as e:
+        _LOGGER.error(f"WebSocket logger tree request failed: {e}", exc_info=True)
+        connection.send_error(msg["id"], "tree_failed", f"Logger tree request failed: {str(e)}")
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_effective_levels",
+    vol.Optional("level"): vol.In(LEVELS),
+    vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)),
+})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_get_effective_levels(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for effective level counts (and loggers at one level)."""
+    effective_levels = hass.data[DOMAIN]["effective_levels"]
+    # A full rebuild (first call, default level changed) runs in slices off the loop's critical path
+    await effective_levels.async_refresh()
+    result = {"counts": effective_levels.counts()}
+    if "level" in msg:
+        loggers = effective_levels.loggers_at(msg["level"])
+        result["level"] = msg["level"]
+        result["total"] = len(loggers)
+        result["loggers"] = loggers[msg["offset"]:msg["offset"] + msg["limit"]]
+    connection.send_result(msg["id"], result)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_log_volume",
+    vol.Optional("limit", default=VOLUME_TOP_N): vol.All(vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)),
+})
+@websocket_api.require_admin
+@callback
+def websocket_get_log_volume(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for the noisiest loggers by records/sec."""
+    handler = hass.data[DOMAIN].get("volume_handler")
+    if handler is None:
+        connection.send_error(msg["id"], "not_enabled", "Log volume tracking is disabled in the options")
+        return
+    connection.send_result(msg["id"], {
+        "window": handler.window,
+        "since": datetime.fromtimestamp(handler.since).isoformat(),
+        "total_rate": handler.total_rate(),
+        "loggers": handler.top(msg["limit"]),
+    })
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_profile",
+})
+@websocket_api.require_admin
+@callback
+def websocket_get_profile(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for the logging-cost profile."""
+    connection.send_result(msg["id"], hass.data[DOMAIN]["profiler"].stats())
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/stats",
+})
+@websocket_api.require_admin
+@callback
+def websocket_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for the integration's own performance metrics."""
+    connection.send_result(msg["id"], _get_metrics(hass).as_dict())
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_managed_loggers",
+    vol.Optional("offset", default=0): vol.All(vol.Coerce(int), vol.Range(min=0)),
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)),
+})
+@websocket_api.require_admin
+@callback
+def websocket_get_managed_loggers(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for one page of managed loggers, sorted by name.
+
+    The hash matches the sensor's managed_hash attribute, so clients only
+    need to refetch when it changes.
+    """
+    managed_data = hass.data[DOMAIN]
+    managed_loggers = managed_data["managed_loggers"]
+    throttles = managed_data["throttles"].settings()
+    expirations = managed_data["expirations"].expiring()
+
+    page = []
+    for name in sorted(managed_loggers)[msg["offset"]:msg["offset"] + msg["limit"]]:
+        item = {"name": name, "level": managed_loggers[name]}
+        if name in throttles:
+            item["throttle"] = throttles[name]
+        if name in expirations:
+            item["expires_at"] = expirations[name]["expires_at"]
+        page.append(item)
+
+    connection.send_result(msg["id"], {
+        "total": len(managed_loggers),
+        "hash": managed_digest(managed_loggers),
+        "last_updated": managed_data.get("last_updated"),
+        "loggers": page,
+    })
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/get_history",
+    vol.Optional("limit", default=SEARCH_DEFAULT_LIMIT): vol.All(vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_LIMIT)),
+    vol.Optional("before"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional("logger"): str,
+    vol.Optional("source"): vol.In([SOURCE_SERVICE, SOURCE_EXPIRY, SOURCE_RESTORE, SOURCE_CLEANUP]),
+})
+@websocket_api.require_admin
+@callback
+def websocket_get_history(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Handle WebSocket request for recent level changes, newest first.
+
+    Page backwards by passing the seq of the last entry received as before.
+    """
+    journal = hass.data[DOMAIN]["journal"]
+    entries = journal.history(msg["limit"], msg.get("before"), msg.get("logger"), msg.get("source"))
+    connection.send_result(msg["id"], {
+        "entries": entries,
+        "seq": journal.seq,
+    })
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): "logger_manager/subscribe",
+})
+@websocket_api.require_admin
+@websocket_api.async_response
+async def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict,
+) -> None:
+    """Subscribe to logger list and managed level changes.
+
+    Sends one snapshot event, then only deltas:
+    {"type": "loggers", "added": [...], "removed": [...]} and
+    {"type": "levels", "changed": {name: level}, "removed": [...],
+    "throttled": {name: settings or None}}.
+    """
+    try:
+        cache_data, _ = await _async_get_or_discover(hass)
+    except Exception as e:
+        _LOGGER.error(f"WebSocket subscribe failed: {e}", exc_info=True)
+        connection.send_error(msg["id"], "discovery_failed", f"Logger discovery failed: {str(e)}")
+        return
+
+    @callback
+    def _forward_loggers(added: list[str], removed: list[str]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], {
+            "type": "loggers",
+            "added": added,
+            "removed": removed,
+        }))
+
+    @callback
+    def _forward_levels(changed: dict[str, str], removed: list[str], throttled: dict[str, dict | None]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], {
+            "type": "levels",
+            "changed": changed,
+            "removed": removed,
+            "throttled": throttled,
+            "last_updated": hass.data[DOMAIN].get("last_updated"),
+        }))
+
+    unsubs = [
+        async_dispatcher_connect(hass, SIGNAL_LOGGERS_UPDATED, _forward_loggers),
+        async_dispatcher_connect(hass, SIGNAL_LEVELS_UPDATED, _forward_levels),
+    ]
+
+    @callback
+    def _unsubscribe() -> None:
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+
+    managed_data = hass.data[DOMAIN]
+    connection.send_message(websocket_api.event_message(msg["id"], {
+        "type": "snapshot",
+        "loggers": cache_data["loggers"],
+        "managed_loggers": dict(managed_data["managed_loggers"]),
+        "throttled": managed_data["throttles"].settings(),
+        "last_updated": managed_data.get("last_updated"),
+    }))
+
+
 async def async_refresh_logger_cache(call: ServiceCall) -> None:
     """Service to manually refresh the logger cache."""
     hass = call.hass
@@ -216,21 +825,345 @@ async def async_refresh_logger_cache(call: ServiceCall) -> None:
     try:
         _LOGGER.info("Manual logger cache refresh requested")
 
-        # Clear existing cache
+        # Let a discovery already in flight finish so it cannot overwrite the rescan
+        task = hass.data[DOMAIN].get(DISCOVERY_TASK_KEY)
+        if task is not None and not task.done():
+            await _async_wait_for_discovery(hass)
+
+        # Clear existing cache and force a full rescan of loggerDict
         if DOMAIN in hass.data and CACHE_KEY in hass.data[DOMAIN]:
             del hass.data[DOMAIN][CACHE_KEY]
+        _get_discovery_index(hass).reset()
 
-        # Discover fresh loggers
-        loggers = await _discover_available_loggers(hass)
+        # Discover fresh loggers; requests arriving meanwhile wait for this run
+        cache_data = await _async_wait_for_discovery(hass)
 
-        # Update cache
-        _update_logger_cache(hass, loggers)
-
-        _LOGGER.info(f"Logger cache refreshed with {len(loggers)} loggers")
+        _LOGGER.info(f"Logger cache refreshed with {len(cache_data['loggers'])} loggers")
 
     except Exception as e:
         _LOGGER.error(f"Manual cache refresh failed: {e}", exc_info=True)
 
+async def async_profile_loggers(call: ServiceCall) -> None:
+    """Start or stop profiling the time loggers spend handling records."""
+    data = PROFILE_SCHEMA(dict(call.data))
+    profiler = call.hass.data[DOMAIN]["profiler"]
+    if not data["enabled"]:
+        profiler.stop()
+        _LOGGER.info("Logging-cost profiling stopped")
+        return
+    if not data["loggers"]:
+        raise vol.Invalid("loggers is required when enabling profiling")
+    profiler.start(data["loggers"])
+    _LOGGER.info(f"Profiling logging cost of {len(data['loggers'])} logger(s)")
+
+
+def _state_snapshot(hass: HomeAssistant) -> dict:
+    """Return a copy of the managed state as it is persisted."""
+    managed_data = hass.data[DOMAIN]
+    return {
+        "managed_loggers": dict(managed_data["managed_loggers"]),
+        "managed_throttles": managed_data["throttles"].settings(),
+        "expirations": managed_data["expirations"].settings(),
+        "last_updated": managed_data["last_updated"],
+        "journal_seq": managed_data["journal"].seq,
+    }
+
+
+def _state_digest(data: dict) -> str:
+    """Return a digest of the serialized state, used to skip unchanged writes."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@callback
+def _async_cancel_save(hass: HomeAssistant) -> bool:
+    """Cancel a pending delayed save; return True if one was pending."""
+    unsub = hass.data[DOMAIN].pop("save_unsub", None)
+    if unsub is None:
+        return False
+    unsub()
+    return True
+
+
+@callback
+def _async_schedule_save(hass: HomeAssistant) -> None:
+    """Save the managed state after the configured delay.
+
+    Calls within the delay are coalesced into one write. If the state
+    matches the last save again, a pending write is cancelled; the write
+    itself checks once more, since the state can change back meanwhile.
+    """
+    managed_data = hass.data[DOMAIN]
+    if _state_digest(_state_snapshot(hass)) == managed_data.get("saved_digest"):
+        _LOGGER.debug("Logger state unchanged since last save, skipping write")
+        _get_metrics(hass).incr("state_saves_skipped")
+        _async_cancel_save(hass)
+        return
+
+    entry = managed_data.get("entry")
+    delay = DEFAULT_SAVE_DELAY
+    if entry and entry.options:
+        delay = entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+
+    async def _async_delayed_write(_now=None) -> None:
+        managed_data.pop("save_unsub", None)
+        await _async_write_state(hass)
+
+    _async_cancel_save(hass)
+    managed_data["save_unsub"] = async_call_later(hass, delay, _async_delayed_write)
+
+
+async def _async_write_state(hass: HomeAssistant) -> None:
+    """Write the managed state unless it matches the last save."""
+    managed_data = hass.data[DOMAIN]
+    metrics = _get_metrics(hass)
+    async with managed_data["save_lock"]:
+        with metrics.timer("state_snapshot"):
+            data = _state_snapshot(hass)
+            digest = _state_digest(data)
+        if digest == managed_data.get("saved_digest"):
+            _LOGGER.debug("Logger state unchanged since last save, skipping write")
+            metrics.incr("state_saves_skipped")
+            return
+
+        _LOGGER.debug(f"Persisting logger state for {len(data['managed_loggers'])} loggers")
+        # Set before the write so a change back to the old state while it is
+        # in flight still schedules another save
+        managed_data["saved_digest"] = digest
+        metrics.incr("state_saves")
+        await managed_data["store"].async_save(data)
+
+        # The snapshot on disk now covers the journal up to its sequence number;
+        # compacting any earlier could drop entries a crash would still need
+        await managed_data["journal"].async_compact(data["journal_seq"])
+
+
+async def _async_flush_state(hass: HomeAssistant) -> None:
+    """Write a pending delayed save of the managed state now and wait for it."""
+    if _async_cancel_save(hass):
+        await _async_write_state(hass)
+        return
+    # A write already in flight holds the lock until it has finished
+    async with hass.data[DOMAIN]["save_lock"]:
+        pass
+
+
+async def _async_apply_restore(hass: HomeAssistant, mapping: dict[str, str], phase: str) -> None:
+    """Apply saved levels in one bulk batch and record how long it took."""
+    start = time.perf_counter()
+    try:
+        changed, skipped = await hass.data[DOMAIN]["level_applier"].async_apply(mapping)
+    except Exception as e:
+        _LOGGER.error(f"Failed to restore logger levels on startup: {e}")
+        return
+
+    # The restore reapplies the saved state rather than changing it; record a
+    # summary so the entry stays small and is never replayed
+    hass.data[DOMAIN]["journal"].record(
+        SOURCE_RESTORE, [], {"phase": phase, "count": len(mapping), "applied": len(changed)}
+    )
+
+    duration_ms = round((time.perf_counter() - start) * 1000, 2)
+    hass.data[DOMAIN].setdefault("restore_stats", {})[phase] = {
+        "count": len(mapping),
+        "applied": len(changed),
+        "skipped": len(skipped),
+        "duration_ms": duration_ms,
+        "finished": datetime.now().isoformat(),
+    }
+    _LOGGER.info(
+        f"Restored {len(mapping)} logger level(s) ({phase}) in {duration_ms} ms: "
+        f"{len(changed)} applied, {len(skipped)} already set"
+    )
+
+
+async def _async_restore_levels(hass: HomeAssistant, entry: ConfigEntry, managed_loggers: dict[str, str]) -> None:
+    """Reapply saved levels according to the configured restore mode.
+
+    In deferred mode only loggers matching the critical patterns are applied
+    during setup; the rest are applied once Home Assistant has started, so a
+    large restore stays off the startup critical path.
+    """
+    hass.data[DOMAIN]["restore_stats"] = {}
+    mode = entry.options.get(CONF_RESTORE_MODE, DEFAULT_RESTORE_MODE)
+    if mode != RESTORE_MODE_DEFERRED or hass.state is CoreState.running:
+        await _async_apply_restore(hass, managed_loggers, "immediate")
+        return
+
+    critical_matcher = LoggerMatcher(entry.options.get(CONF_CRITICAL_LOGGERS, []))
+    critical = {name: level for name, level in managed_loggers.items() if critical_matcher.match(name)}
+    deferred = {name: level for name, level in managed_loggers.items() if name not in critical}
+
+    if critical:
+        await _async_apply_restore(hass, critical, "critical")
+
+    if deferred:
+        _LOGGER.debug(f"Deferring restore of {len(deferred)} logger level(s) until Home Assistant has started")
+
+        async def _async_restore_deferred(hass: HomeAssistant) -> None:
+            # Levels may have expired or been changed while startup was running
+            managed = hass.data[DOMAIN]["managed_loggers"]
+            current = {name: managed[name] for name in deferred if name in managed}
+            await _async_apply_restore(hass, current, "deferred")
+
+        entry.async_on_unload(async_at_started(hass, _async_restore_deferred))
+
+
+async def _async_expand_levels(hass: HomeAssistant, levels: dict[str, str]) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """Expand glob keys of a {name or pattern: level} mapping against discovered loggers.
+
+    Returns the {logger: level} mapping and the loggers each glob matched.
+    Entries are applied in order, so a later entry overrides an earlier one.
+    """
+    mapping: dict[str, str] = {}
+    expanded: dict[str, list[str]] = {}
+    discovered = None
+    for pattern, level in levels.items():
+        if is_literal(pattern):
+            mapping[pattern] = level
+            continue
+        if discovered is None:
+            cache_data, _ = await _async_get_or_discover(hass)
+            discovered = cache_data["loggers"]
+        names = LoggerMatcher([pattern]).filter(discovered)
+        expanded[pattern] = names
+        for name in names:
+            mapping[name] = level
+    return mapping, expanded
+
+
+async def _async_apply_levels(
+    hass: HomeAssistant,
+    mapping: dict[str, str],
+    throttle: dict[str, float] | None = None,
+    duration: timedelta | None = None,
+    source: str = SOURCE_SERVICE,
+) -> dict:
+    """Apply a {logger: level} mapping, track it as managed and journal the changes.
+
+    throttle holds rate_limit and/or sample_ratio for every listed logger;
+    omitted settings keep their current value. With a duration each logger
+    returns to the level it had before (or the default) once it expires;
+    without one any pending expiration for the logger is cancelled.
+
+    Level changes are appended to the journal; the full state snapshot is
+    only saved when throttles or expirations change, or to compact it.
+    """
+    start = time.perf_counter_ns()
+    managed_data = hass.data[DOMAIN]
+    managed_loggers = managed_data["managed_loggers"]
+    expirations = managed_data["expirations"]
+
+    # Smart debug logging for our own integration
+    our_integration = "custom_components.logger_manager"
+    our_level = mapping.get(our_integration)
+    if our_level is not None:
+        # Get current managed level for our integration
+        current_level = managed_loggers.get(our_integration, "warning")
+
+        # Log BEFORE if changing FROM debug (while debug still visible)
+        if current_level.lower() == "debug" and our_level.lower() != "debug":
+            _LOGGER.debug(f"Setting {our_integration} to {our_level}")
+
+    # Remember what each logger reverts to before its level is replaced;
+    # extending a pending expiration keeps the original revert level
+    expires_at = None
+    if duration:
+        expires_at = time.time() + duration.total_seconds()
+        revert_to = {
+            name: expirations.revert_level(name) or managed_loggers.get(name, "notset")
+            for name in mapping
+        }
+
+    # Call Home Assistant's built-in logger service with only the real changes
+    # (concurrent calls are merged into one logger.set_level call)
+    changed_names, skipped_names = await managed_data["level_applier"].async_apply(mapping)
+
+    # Note: HA's logger service accepts any logger name, even invalid/non-existent ones.
+    # It will create overrides for non-existent loggers which have no effect but are tracked.
+    # This matches HA's built-in behavior. Users can remove invalid loggers by setting
+    # them to the default level, which will trigger auto-cleanup in the sensor.
+
+    # Smart debug logging continued: log AFTER if changing TO debug (so the
+    # message appears); other loggers are only visible while ours is at debug
+    if our_level is not None and our_level.lower() == "debug":
+        _LOGGER.debug(f"Setting {our_integration} to {our_level}")
+    for logger_name, level in mapping.items():
+        if logger_name != our_integration:
+            _LOGGER.debug(f"Setting {logger_name} to {level}")
+
+    # Track all loggers we requested (matches HA's behavior). Re-read the
+    # mapping: it may have been replaced while the service call was awaited
+    managed_loggers = managed_data["managed_loggers"]
+    changed: dict[str, str] = {}
+    removed: list[str] = []
+    journal_changes: list[dict] = []
+    system_default = managed_data.get("system_default_level", "warning")
+    for logger_name, level in mapping.items():
+        old = managed_loggers.get(logger_name)
+        # Remove from managed if set to system default or notset
+        if level.lower() == system_default or level.lower() == "notset":
+            if managed_loggers.pop(logger_name, None) is not None:
+                removed.append(logger_name)
+                journal_changes.append({"logger": logger_name, "old": old, "new": None})
+        elif old != level:
+            managed_loggers[logger_name] = level
+            changed[logger_name] = level
+            journal_changes.append({"logger": logger_name, "old": old, "new": level})
+    managed_data["last_updated"] = datetime.now().isoformat()
+    journal = managed_data["journal"]
+    journal.record(source, journal_changes)
+
+    # Time-boxed levels: one central scheduler drives every expiration
+    expiring = False
+    for logger_name in mapping:
+        if expires_at is not None:
+            expirations.schedule(logger_name, expires_at, revert_to[logger_name])
+            expiring = True
+        elif logger_name in expirations:
+            expirations.cancel(logger_name)
+            expiring = True
+
+    # Rate limiting / sampling; omitted settings keep their current value.
+    # Only loggers whose settings actually changed are reported
+    throttled: dict[str, dict | None] = {}
+    if throttle:
+        throttles = managed_data["throttles"]
+        for logger_name in mapping:
+            current = throttles.get(logger_name)
+            settings = {"rate_limit": None, "sample_ratio": None, **(current or {}), **throttle}
+            throttles.set(logger_name, settings["rate_limit"], settings["sample_ratio"])
+            updated = throttles.get(logger_name)
+            if updated != current:
+                throttled[logger_name] = updated
+
+    if changed or removed or throttled or expiring:
+        async_dispatcher_send(hass, SIGNAL_LEVELS_UPDATED, changed, removed, throttled)
+
+    _LOGGER.debug(
+        f"Successfully set {len(mapping)} logger(s): "
+        f"{len(changed_names)} changed, {len(skipped_names)} already set"
+    )
+
+    # Persist the state snapshot (debounced) when the journal does not cover it
+    if throttled or expiring or source == SOURCE_EXPIRY or journal.uncompacted >= JOURNAL_COMPACT_EVERY:
+        _async_schedule_save(hass)
+
+    result = {
+        "changed": len(changed_names),
+        "skipped": len(skipped_names),
+        "changed_loggers": changed_names,
+        "throttled": throttled,
+    }
+    if expires_at is not None:
+        result["expires_at"] = datetime.fromtimestamp(expires_at).isoformat()
+
+    metrics = _get_metrics(hass)
+    metrics.observe("apply_levels", time.perf_counter_ns() - start)
+    metrics.size("apply_batch", len(mapping))
+    metrics.size("apply_changed", len(changed_names))
+    return result
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Logger Manager from a config entry."""
 
@@ -249,35 +1182,124 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.debug("Starting frontend registration from async_setup_entry")
         from .frontend import JSModuleRegistration
         module_register = JSModuleRegistration(hass)
-        await module_register.async_register()
+        # Lovelace may still have to load its resources; don't hold up setup for it
+        hass.async_create_background_task(
+            module_register.async_register(), "logger_manager frontend registration"
+        )
         hass.data[DOMAIN]["frontend_registered"] = True
-        _LOGGER.debug("Frontend registration completed from async_setup_entry")
+        _LOGGER.debug("Frontend registration started from async_setup_entry")
     else:
         _LOGGER.debug("Frontend already registered, skipping registration")
 
+    # Level changes go through the diff-aware, batching applier
+    hass.data[DOMAIN]["level_applier"] = LevelApplier(hass)
+
+    # Effective levels of all loggers, recomputed per subtree on logger.* calls
+    effective_levels = hass.data[DOMAIN].setdefault("effective_levels", EffectiveLevelCache())
+    effective_levels.slice_budget = entry.options.get(CONF_DISCOVERY_SLICE_MS, DEFAULT_DISCOVERY_SLICE_MS) / 1000
+
+    @callback
+    def _logger_service_called(event: Event) -> None:
+        if event.data.get("domain") != "logger":
+            return
+        if event.data.get("service") == "set_level":
+            effective_levels.invalidate(event.data.get("service_data", {}).keys())
+        else:
+            # set_default_level (or anything else) can affect every logger
+            effective_levels.invalidate()
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_CALL_SERVICE, _logger_service_called))
+
+    # Count records per logger at the root logger (opt-out via options)
+    if entry.options.get(CONF_VOLUME_TRACKING, DEFAULT_VOLUME_TRACKING):
+        volume_handler = LogVolumeHandler()
+        logging.getLogger().addHandler(volume_handler)
+        hass.data[DOMAIN]["volume_handler"] = volume_handler
+
+    # Rate limiting / sampling filters attached to managed loggers
+    throttles = hass.data[DOMAIN].setdefault("throttles", ThrottleManager())
+
+    # Opt-in logging-cost profiler (inactive until the service enables it)
+    hass.data[DOMAIN].setdefault("profiler", LoggingProfiler())
+    _get_metrics(hass)
+
+    # Time-boxed levels; expired entries are reverted in one batch
+    async def _async_revert_expired(due: dict[str, str]) -> None:
+        await _async_apply_levels(hass, due, source=SOURCE_EXPIRY)
+
+    expirations = ExpiryScheduler(hass, _async_revert_expired)
+    hass.data[DOMAIN]["expirations"] = expirations
+    entry.async_on_unload(expirations.async_stop)
+
+    # Serve the last discovery from disk until it is revalidated after startup
+    await _async_load_discovery_cache(hass)
+    entry.async_on_unload(async_at_started(hass, _async_revalidate_discovery))
+
     # Initialize storage
     store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
     hass.data[DOMAIN]["store"] = store
+    # Serializes state writes (delayed, flushed on unload or shutdown)
+    hass.data[DOMAIN]["save_lock"] = asyncio.Lock()
+
+    # Level changes since the last state snapshot
+    journal = ChangeJournal(hass, hass.config.path(STORAGE_DIR, JOURNAL_FILENAME))
+    hass.data[DOMAIN]["journal"] = journal
 
     # Load and restore previous state
     try:
-        stored_data = await store.async_load()
-        if stored_data:
+        stored_data = await store.async_load() or {}
+        await journal.async_load(stored_data.get("journal_seq", 0))
+        replay = journal.entries_since(journal.compacted_seq)
+        if stored_data or replay:
             managed_loggers = stored_data.get("managed_loggers", {})
+            managed_throttles = stored_data.get("managed_throttles", {})
             last_updated = stored_data.get("last_updated")
 
+            # Replay level changes journaled after the snapshot was saved
+            for journal_entry in replay:
+                for change in journal_entry["changes"]:
+                    if change["new"] is None:
+                        managed_loggers.pop(change["logger"], None)
+                    else:
+                        managed_loggers[change["logger"]] = change["new"]
+                last_updated = datetime.fromtimestamp(journal_entry["ts"]).isoformat()
+            if replay:
+                _LOGGER.debug(f"Replayed {len(replay)} journaled level change(s)")
+
+            # Resume pending expirations; those that lapsed while Home Assistant
+            # was down are reverted before anything is restored
+            lapsed: list[dict] = []
+            now = time.time()
+            for logger_name, pending in stored_data.get("expirations", {}).items():
+                revert_to = pending.get("revert_to", "notset")
+                if pending.get("expires", 0) > now:
+                    expirations.schedule(logger_name, pending["expires"], revert_to)
+                    continue
+                old = managed_loggers.get(logger_name)
+                if revert_to == "notset":
+                    managed_loggers.pop(logger_name, None)
+                else:
+                    managed_loggers[logger_name] = revert_to
+                lapsed.append({"logger": logger_name, "old": old, "new": managed_loggers.get(logger_name)})
+
+            # Reattach throttles first so restored debug output is already capped
+            for logger_name, settings in managed_throttles.items():
+                throttles.set(logger_name, settings.get("rate_limit"), settings.get("sample_ratio"))
+
             # Restore previous state to memory
             hass.data[DOMAIN]["managed_loggers"] = managed_loggers
             hass.data[DOMAIN]["last_updated"] = last_updated
+            if lapsed:
+                _LOGGER.info(f"Reverted {len(lapsed)} time-boxed logger level(s) that expired while stopped")
+                journal.record(SOURCE_EXPIRY, lapsed)
+                _async_schedule_save(hass)
+            elif not replay:
+                hass.data[DOMAIN]["saved_digest"] = _state_digest(_state_snapshot(hass))
 
             # Reapply all managed logger levels
             if managed_loggers:
                 _LOGGER.info(f"Restoring {len(managed_loggers)} managed logger levels from previous session")
-                try:
-                    await hass.services.async_call("logger", "set_level", managed_loggers, blocking=True)
-                    _LOGGER.debug(f"Successfully restored logger levels: {managed_loggers}")
-                except Exception as e:
-                    _LOGGER.error(f"Failed to restore logger levels on startup: {e}")
+                await _async_restore_levels(hass, entry, dict(managed_loggers))
             else:
                 _LOGGER.debug("No managed logger levels to restore")
         else:
@@ -288,84 +1310,80 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register services and WebSocket command once globally (not per entry)
     if not hass.data[DOMAIN]["services_registered"]:
 
-        async def handle_apply_levels(call: ServiceCall) -> None:
+        async def handle_apply_levels(call: ServiceCall) -> ServiceResponse:
             """Handle the apply_levels service call."""
             # Copy the data to avoid ReadOnlyDict issues
             data = SCHEMA(dict(call.data))
-            level = data["level"]
-            logger_names = data["loggers"]
-
-            # Smart debug logging for our own integration
-            our_integration = "custom_components.logger_manager"
-            if our_integration in logger_names:
-                # Get current managed level for our integration
-                managed_data = hass.data[DOMAIN]
-                current_level = managed_data["managed_loggers"].get(our_integration, "warning")
-
-                # Log BEFORE if changing FROM debug (while debug still visible)
-                if current_level.lower() == "debug" and level.lower() != "debug":
-                    _LOGGER.debug(f"Setting {our_integration} to {level}")
-
-            # Create mapping for HA's logger.set_level service
-            mapping = {name: level for name in logger_names}
-
-            # Call Home Assistant's built-in logger service
-            await hass.services.async_call("logger", "set_level", mapping, blocking=True)
-
-            # Note: HA's logger service accepts any logger name, even invalid/non-existent ones.
-            # It will create overrides for non-existent loggers which have no effect but are tracked.
-            # This matches HA's built-in behavior. Users can remove invalid loggers by setting
-            # them to the default level, which will trigger auto-cleanup in the sensor.
-
-            # Smart debug logging continued
-            if our_integration in logger_names:
-                # Log AFTER if changing TO debug (so debug message appears)
-                if level.lower() == "debug":
-                    _LOGGER.debug(f"Setting {our_integration} to {level}")
-                    # Also log other integrations now that debug is active
-                    for logger_name in logger_names:
-                        if logger_name != our_integration:
-                            _LOGGER.debug(f"Setting {logger_name} to {level}")
-            else:
-                # Log for other integrations only (our integration wasn't in the list)
-                for logger_name in logger_names:
-                    if logger_name != our_integration:
-                        _LOGGER.debug(f"Setting {logger_name} to {level}")
-
-            # Track all loggers we requested (matches HA's behavior)
-            managed_data = hass.data[DOMAIN]
-            for logger_name in logger_names:
-                # Remove from managed if set to system default or notset
-                system_default = managed_data.get("system_default_level", "warning")
-                if level.lower() == system_default or level.lower() == "notset":
-                    managed_data["managed_loggers"].pop(logger_name, None)
-                else:
-                    managed_data["managed_loggers"][logger_name] = level
-            managed_data["last_updated"] = datetime.now().isoformat()
+            mapping = {name: data["level"] for name in data.get("loggers", [])}
 
-            _LOGGER.debug(f"Successfully set all {len(logger_names)} logger(s)")
+            # levels: {logger or glob: level}, globs expanded against discovered loggers
+            expanded: dict[str, list[str]] = {}
+            if "levels" in data:
+                levels_mapping, expanded = await _async_expand_levels(hass, data["levels"])
+                mapping.update(levels_mapping)
 
-            # Persist the state to storage
-            try:
-                store = managed_data["store"]
-                await store.async_save({
-                    "managed_loggers": managed_data["managed_loggers"],
-                    "last_updated": managed_data["last_updated"]
-                })
-                _LOGGER.debug(f"Persisted logger state for {len(logger_names)} loggers")
-            except Exception as e:
-                _LOGGER.error(f"Failed to persist logger state: {e}")
+            throttle = {key: data[key] for key in ("rate_limit", "sample_ratio") if key in data}
+
+            # Everything goes out as one batch with one journal entry
+            result = await _async_apply_levels(hass, mapping, throttle=throttle, duration=data.get("duration"))
+            if not call.return_response:
+                return None
+            result["loggers"] = len(mapping)
+            if expanded:
+                result["expanded"] = expanded
+            return result
 
         # Register services
-        hass.services.async_register(DOMAIN, "apply_levels", handle_apply_levels)
+        hass.services.async_register(
+            DOMAIN,
+            "apply_levels",
+            handle_apply_levels,
+            supports_response=SupportsResponse.OPTIONAL,
+        )
         hass.services.async_register(DOMAIN, "refresh_logger_cache", async_refresh_logger_cache, schema=TEST_SCHEMA)
+        hass.services.async_register(DOMAIN, "profile_loggers", async_profile_loggers)
 
         # Register WebSocket command
         websocket_api.async_register_command(hass, websocket_get_loggers)
+        websocket_api.async_register_command(hass, websocket_search_loggers)
+        websocket_api.async_register_command(hass, websocket_get_logger_tree)
+        websocket_api.async_register_command(hass, websocket_get_effective_levels)
+        websocket_api.async_register_command(hass, websocket_get_log_volume)
+        websocket_api.async_register_command(hass, websocket_get_profile)
+        websocket_api.async_register_command(hass, websocket_stats)
+        websocket_api.async_register_command(hass, websocket_get_history)
+        websocket_api.async_register_command(hass, websocket_get_managed_loggers)
+        websocket_api.async_register_command(hass, websocket_subscribe)
 
         hass.data[DOMAIN]["services_registered"] = True
         _LOGGER.debug("Services and WebSocket command registered")
 
+    # Write a pending state save and journal entries before Home Assistant shuts down
+    async def _async_final_write(event: Event) -> None:
+        await _async_flush_state(hass)
+        await journal.async_flush()
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_final_write))
+
+    # Keep the discovery index current as integrations load (new loggers appear)
+    async def _async_refresh() -> None:
+        await _async_refresh_discovery(hass)
+
+    discovery_debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=DISCOVERY_DEBOUNCE,
+        immediate=False,
+        function=_async_refresh,
+    )
+
+    @callback
+    def _component_loaded(event: Event) -> None:
+        discovery_debouncer.async_schedule_call()
+
+    entry.async_on_unload(hass.bus.async_listen(EVENT_COMPONENT_LOADED, _component_loaded))
+    entry.async_on_unload(discovery_debouncer.async_cancel)
+
     # Forward entry setup to sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -387,12 +1405,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
+    # Flush any pending (debounced) state write and journal entries
+    await _async_flush_state(hass)
+    await hass.data[DOMAIN]["journal"].async_flush()
+
+    # Detach throttle filters (restored from storage on the next setup)
+    hass.data[DOMAIN]["throttles"].clear()
+
+    # Remove profiling wrappers
+    hass.data[DOMAIN]["profiler"].stop()
+
+    # Stop a discovery still in flight
+    task = hass.data[DOMAIN].pop(DISCOVERY_TASK_KEY, None)
+    if task is not None:
+        task.cancel()
+
+    # Stop counting log records
+    volume_handler = hass.data[DOMAIN].pop("volume_handler", None)
+    if volume_handler is not None:
+        logging.getLogger().removeHandler(volume_handler)
+
     # Config-entry update listener is auto-unregistered via entry.async_on_unload() in async_setup_entry
 
     # Unregister services if they were registered
     if hass.data[DOMAIN].get("services_registered", False):
         hass.services.async_remove(DOMAIN, "apply_levels")
         hass.services.async_remove(DOMAIN, "refresh_logger_cache")
+        hass.services.async_remove(DOMAIN, "profile_loggers")
         hass.data[DOMAIN]["services_registered"] = False
         _LOGGER.debug("Unregistered Logger Manager services")
 
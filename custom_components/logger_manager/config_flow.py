@@ -1,10 +1,73 @@
 from __future__ import annotations
 
+import logging
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
 from homeassistant.helpers import selector
-from .const import DOMAIN, CONF_FILTER_PATTERNS, DEFAULT_FILTER_PATTERNS
+from .const import (
+    DOMAIN,
+    CONF_CRITICAL_LOGGERS,
+    CONF_DISCOVERY_SLICE_MS,
+    CONF_FILTER_PATTERNS,
+    CONF_MAX_PATTERN_MATCHES,
+    CONF_RESTORE_MODE,
+    CONF_SAVE_DELAY,
+    CONF_VOLUME_TRACKING,
+    DEFAULT_DISCOVERY_SLICE_MS,
+    DEFAULT_FILTER_PATTERNS,
+    DEFAULT_MAX_PATTERN_MATCHES,
+    DEFAULT_RESTORE_MODE,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_VOLUME_TRACKING,
+    MAX_PATTERN_WILDCARDS,
+    RESTORE_MODES,
+)
+from .matcher import pattern_report, wildcard_count
+
+
+def _parse_lines(raw) -> list[str]:
+    """Return stripped, de-duplicated, non-empty entries from a list or legacy string."""
+    # Accept either a list (new) or legacy string (old)
+    if isinstance(raw, str):
+        lines = [ln.strip() for ln in raw.splitlines()]
+    elif isinstance(raw, list):
+        lines = [str(x).strip() for x in raw]
+    else:
+        lines = []
+
+    seen, result = set(), []
+    for p in lines:
+        if p and p not in seen:
+            seen.add(p)
+            result.append(p)
+    return result
+
+
+def _format_report(report: list[dict], max_matches: int) -> str:
+    """Return a markdown list describing each pattern's matches and cost.
+
+    Timings are informational only: one wall-clock run varies too much
+    between submits to reject a pattern on. The wildcard count is what the
+    cost guardrail checks.
+    """
+    lines = []
+    for item in report:
+        notes = []
+        if item["matches"] > max_matches:
+            notes.append(f"over the {max_matches} logger limit")
+        if item["wildcards"] > MAX_PATTERN_WILDCARDS:
+            notes.append(f"more than {MAX_PATTERN_WILDCARDS} wildcards")
+        if item["redundant"]:
+            notes.append("already covered by the built-in patterns")
+        elif not item["matches"]:
+            notes.append("matches no current logger")
+        suffix = f" — {', '.join(notes)}" if notes else ""
+        lines.append(f"- `{item['pattern']}`: {item['matches']} loggers, {item['ms']} ms{suffix}")
+    total_ms = round(sum(item["ms"] for item in report), 2)
+    lines.append(f"\nTotal: {sum(item['matches'] for item in report)} matches, {total_ms} ms per full scan")
+    return "\n".join(lines)
 
 
 class LoggerManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -34,48 +97,139 @@ class LoggerManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class LoggerManagerOptionsFlowHandler(config_entries.OptionsFlow):
     """Options flow for runtime settings."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict = {}
+        self._preview = ""
+
+    async def _async_pattern_report(self, patterns: list[str]) -> list[dict]:
+        """Match the patterns against every current logger name in the executor."""
+        names = [name for name in list(logging.Logger.manager.loggerDict) if isinstance(name, str)]
+        return await self.hass.async_add_executor_job(pattern_report, patterns, names, DEFAULT_FILTER_PATTERNS)
+
     async def async_step_init(self, user_input=None):
         errors: dict[str, str] = {}
+        preview = ""
 
         if user_input is not None:
-            raw = user_input.get(CONF_FILTER_PATTERNS, [])
-
-            # Accept either a list (new) or legacy string (old)
-            if isinstance(raw, str):
-                lines = [ln.strip() for ln in raw.splitlines()]
-            elif isinstance(raw, list):
-                lines = [str(x).strip() for x in raw]
-            else:
-                lines = []
-
             # Normalize, dedupe, and guardrail
-            seen, extras = set(), []
-            for p in lines:
-                if not p:
-                    continue
+            extras = []
+            for p in _parse_lines(user_input.get(CONF_FILTER_PATTERNS, [])):
                 if p == "*":
                     errors[CONF_FILTER_PATTERNS] = "too_broad"
                     continue
-                if p not in seen:
-                    seen.add(p)
-                    extras.append(p)
+                # Cheap, deterministic cost bound: every wildcard adds backtracking
+                # to the regex run against each logger name on every discovery pass
+                if wildcard_count(p) > MAX_PATTERN_WILDCARDS:
+                    errors[CONF_FILTER_PATTERNS] = "too_complex"
+                extras.append(p)
+
+            max_matches = int(user_input.get(CONF_MAX_PATTERN_MATCHES, DEFAULT_MAX_PATTERN_MATCHES))
+
+            # Preview what each pattern would add to discovery and what it costs
+            if extras:
+                report = await self._async_pattern_report(extras)
+                preview = _format_report(report, max_matches)
+                if any(item["matches"] > max_matches for item in report):
+                    errors.setdefault(CONF_FILTER_PATTERNS, "too_many_matches")
 
             if not errors:
-                return self.async_create_entry(
-                    title="Logger Manager",
-                    data={CONF_FILTER_PATTERNS: extras},
-                )
+                self._options = {
+                    CONF_FILTER_PATTERNS: extras,
+                    CONF_SAVE_DELAY: user_input.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
+                    CONF_RESTORE_MODE: user_input.get(CONF_RESTORE_MODE, DEFAULT_RESTORE_MODE),
+                    CONF_CRITICAL_LOGGERS: _parse_lines(user_input.get(CONF_CRITICAL_LOGGERS, [])),
+                    CONF_VOLUME_TRACKING: user_input.get(CONF_VOLUME_TRACKING, DEFAULT_VOLUME_TRACKING),
+                    CONF_MAX_PATTERN_MATCHES: max_matches,
+                    CONF_DISCOVERY_SLICE_MS: user_input.get(CONF_DISCOVERY_SLICE_MS, DEFAULT_DISCOVERY_SLICE_MS),
+                }
+                # Changed patterns are confirmed against the preview before saving
+                if extras != self.config_entry.options.get(CONF_FILTER_PATTERNS, []):
+                    self._preview = preview
+                    return await self.async_step_confirm()
+                return self.async_create_entry(title="Logger Manager", data=self._options)
 
-        # Show the form
-        current_extras = self.config_entry.options.get(CONF_FILTER_PATTERNS, [])
+        # Show the form; after a failed submit keep what the user entered
+        current = user_input if user_input is not None else self.config_entry.options
+        current_extras = current.get(CONF_FILTER_PATTERNS, [])
+        current_save_delay = current.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY)
+        current_restore_mode = current.get(CONF_RESTORE_MODE, DEFAULT_RESTORE_MODE)
+        current_critical = current.get(CONF_CRITICAL_LOGGERS, [])
+        current_volume_tracking = current.get(CONF_VOLUME_TRACKING, DEFAULT_VOLUME_TRACKING)
+        current_max_matches = current.get(CONF_MAX_PATTERN_MATCHES, DEFAULT_MAX_PATTERN_MATCHES)
+        current_slice_ms = current.get(CONF_DISCOVERY_SLICE_MS, DEFAULT_DISCOVERY_SLICE_MS)
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema({
                 vol.Optional(
                     CONF_FILTER_PATTERNS,
                     default=current_extras or []
-                ): selector.ObjectSelector()
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=current_save_delay
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=0,
+                        max=300,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_RESTORE_MODE,
+                    default=current_restore_mode
+                ): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=RESTORE_MODES,
+                        translation_key=CONF_RESTORE_MODE,
+                    )
+                ),
+                vol.Optional(
+                    CONF_CRITICAL_LOGGERS,
+                    default=current_critical or []
+                ): selector.ObjectSelector(),
+                vol.Optional(
+                    CONF_VOLUME_TRACKING,
+                    default=current_volume_tracking
+                ): selector.BooleanSelector(),
+                vol.Optional(
+                    CONF_MAX_PATTERN_MATCHES,
+                    default=current_max_matches
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=100000,
+                        step=1,
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
+                vol.Optional(
+                    CONF_DISCOVERY_SLICE_MS,
+                    default=current_slice_ms
+                ): selector.NumberSelector(
+                    selector.NumberSelectorConfig(
+                        min=1,
+                        max=100,
+                        step=1,
+                        unit_of_measurement="ms",
+                        mode=selector.NumberSelectorMode.BOX,
+                    )
+                ),
             }),
             errors=errors,
+            description_placeholders={"preview": preview},
+        )
+
+    async def async_step_confirm(self, user_input=None):
+        """Show the pattern preview and save the options once confirmed."""
+        if user_input is not None:
+            return self.async_create_entry(title="Logger Manager", data=self._options)
+
+        return self.async_show_form(
+            step_id="confirm",
+            data_schema=vol.Schema({}),
+            description_placeholders={"preview": self._preview or "No extra patterns."},
         )
         
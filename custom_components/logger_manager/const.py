@@ -1,5 +1,25 @@
 DOMAIN = "logger_manager"
 CONF_FILTER_PATTERNS = "extra_filter_patterns"
+CONF_SAVE_DELAY = "save_delay"
+DEFAULT_SAVE_DELAY = 10  # seconds to coalesce state writes
+CONF_RESTORE_MODE = "restore_mode"
+CONF_CRITICAL_LOGGERS = "critical_loggers"
+RESTORE_MODE_IMMEDIATE = "immediate"
+RESTORE_MODE_DEFERRED = "deferred"
+RESTORE_MODES = [RESTORE_MODE_IMMEDIATE, RESTORE_MODE_DEFERRED]
+DEFAULT_RESTORE_MODE = RESTORE_MODE_IMMEDIATE
+CONF_VOLUME_TRACKING = "volume_tracking"
+DEFAULT_VOLUME_TRACKING = True
+CONF_MAX_PATTERN_MATCHES = "max_pattern_matches"
+DEFAULT_MAX_PATTERN_MATCHES = 2000  # loggers one extra pattern may add
+MAX_PATTERN_WILDCARDS = 4  # wildcards per extra pattern; each adds regex backtracking on every logger
+CONF_DISCOVERY_SLICE_MS = "discovery_slice_ms"
+DEFAULT_DISCOVERY_SLICE_MS = 4  # ms discovery may hold the event loop before yielding
+
+# Dispatcher signals
+SIGNAL_LOGGERS_UPDATED = f"{DOMAIN}_loggers_updated"
+SIGNAL_LEVELS_UPDATED = f"{DOMAIN}_levels_updated"
+
 DEFAULT_FILTER_PATTERNS = [
     "homeassistant*",
     "custom_components*",
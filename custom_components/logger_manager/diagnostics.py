@@ -0,0 +1,35 @@
+"""Diagnostics support for Logger Manager."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    managed_data = hass.data.get(DOMAIN, {})
+    throttles = managed_data.get("throttles")
+    profiler = managed_data.get("profiler")
+    volume_handler = managed_data.get("volume_handler")
+    journal = managed_data.get("journal")
+    metrics = managed_data.get("metrics")
+
+    return {
+        "options": dict(entry.options),
+        "managed_count": len(managed_data.get("managed_loggers", {})),
+        "last_updated": managed_data.get("last_updated"),
+        "restore": managed_data.get("restore_stats", {}),
+        "logger_cache": {
+            "source": managed_data.get("logger_cache", {}).get("source"),
+            "version": managed_data.get("logger_cache", {}).get("version"),
+        },
+        "journal": {"seq": journal.seq, "uncompacted": journal.uncompacted} if journal else None,
+        "throttled_loggers": throttles.stats() if throttles else {},
+        "log_volume": volume_handler.top() if volume_handler else None,
+        "profile": profiler.stats() if profiler else None,
+        "metrics": metrics.as_dict() if metrics else None,
+    }
@@ -0,0 +1,159 @@
+"""Incremental logger discovery index for Logger Manager."""
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator
+import heapq
+from itertools import islice
+import time
+
+from .matcher import LoggerMatcher
+
+DISCOVERY_CHUNK = 500  # names handled between two checks of the slice budget
+
+
+class SliceBudget:
+    """Tell a stepped refresh when its current slice has used up its time."""
+
+    def __init__(self, seconds: float | None) -> None:
+        """Start the first slice; None means one unlimited slice."""
+        self._seconds = seconds
+        self.restart()
+
+    def restart(self) -> None:
+        """Start a new slice."""
+        self._deadline = time.perf_counter() + self._seconds if self._seconds else None
+
+    def spent(self) -> bool:
+        """Return True if the current slice is over."""
+        return self._deadline is not None and time.perf_counter() >= self._deadline
+
+
+def drain(items: Iterator[str], out: list[str], budget: SliceBudget) -> Generator[None, None, None]:
+    """Move items into out a chunk at a time, yielding when the slice is over."""
+    while chunk := list(islice(items, DISCOVERY_CHUNK)):
+        out.extend(chunk)
+        if budget.spent():
+            yield
+            budget.restart()
+
+
+class DiscoveryIndex:
+    """Track which ``loggerDict`` names match the current patterns.
+
+    ``loggerDict`` is an insertion-ordered dict that only ever grows, so the
+    index remembers how many names it has already scanned and only matches
+    the names appended since then. ``generation`` is bumped whenever the set
+    of matched names changes, which lets callers cheaply tell whether data
+    derived from the index is still current.
+
+    When the index starts over (new patterns or a forced rescan) it keeps the
+    previous result so the next refresh can report what was removed.
+    """
+
+    def __init__(self, matcher: LoggerMatcher, previous: list[str] | None = None) -> None:
+        """Initialize an empty index for the given matcher."""
+        self.matcher = matcher
+        self.generation = 0
+        self._scanned = 0
+        self._matched: set[str] = set()
+        self._sorted: list[str] = []
+        self._previous = previous
+
+    @property
+    def fingerprint(self) -> str | None:
+        """Return the pattern fingerprint this index was built for."""
+        return self.matcher.fingerprint
+
+    @property
+    def loggers(self) -> list[str]:
+        """Return the matched logger names, sorted."""
+        return self._sorted
+
+    @property
+    def scanned(self) -> int:
+        """Return how many loggerDict entries have been processed."""
+        return self._scanned
+
+    def is_stale(self, logger_dict: dict) -> bool:
+        """Return True if loggerDict has changed size since the last refresh."""
+        return len(logger_dict) != self._scanned
+
+    def reset(self) -> None:
+        """Forget everything so the next refresh rescans loggerDict from scratch."""
+        self._scanned = 0
+        if self._previous is None:
+            self._previous = self._sorted
+        if self._matched:
+            self._matched = set()
+            self._sorted = []
+            self.generation += 1
+
+    def refresh(self, logger_dict: dict) -> tuple[list[str], list[str]]:
+        """Match names added to loggerDict since the last refresh.
+
+        Returns the (added, removed) names, sorted. Names are only ever
+        removed by the refresh that follows a reset.
+        """
+        steps = self.refresh_steps(logger_dict)
+        while True:
+            try:
+                next(steps)
+            except StopIteration as done:
+                return done.value
+
+    def refresh_steps(
+        self, logger_dict: dict, budget: float | None = None
+    ) -> Generator[None, None, tuple[list[str], list[str]]]:
+        """Do the work of ``refresh`` in slices of at most ``budget`` seconds.
+
+        The generator yields after each slice so an async caller can give the
+        event loop a turn, and returns (added, removed) when done. It works on
+        a snapshot of the names, so loggers created meanwhile are left for the
+        next refresh. Matches are sorted per chunk and merged, so no single
+        sort or merge covers the whole list at once. The sorted list and the
+        generation only change in the last slice; if the generator is closed
+        early the index is left as it was. Run one refresh at a time.
+        """
+        if len(logger_dict) < self._scanned:
+            # Entries were removed (not done by the logging module itself); start over
+            self.reset()
+
+        slices = SliceBudget(budget)
+        new_names = list(islice(logger_dict, self._scanned, None))
+        matched, match = self._matched, self.matcher.match
+        runs: list[list[str]] = []
+        try:
+            for start in range(0, len(new_names), DISCOVERY_CHUNK):
+                run = sorted({
+                    name for name in new_names[start:start + DISCOVERY_CHUNK]
+                    if isinstance(name, str) and name not in matched and match(name)
+                })
+                if run:
+                    matched.update(run)
+                    runs.append(run)
+                if slices.spent():
+                    yield
+                    slices.restart()
+
+            added: list[str] = []
+            yield from drain(heapq.merge(*runs), added, slices)
+            merged: list[str] = []
+            if added:
+                yield from drain(heapq.merge(self._sorted, added), merged, slices)
+        except BaseException:
+            # Closed or failed part-way: forget the partial matches
+            for run in runs:
+                matched.difference_update(run)
+            raise
+
+        self._scanned += len(new_names)
+        if added:
+            self._sorted = merged
+            self.generation += 1
+
+        removed: list[str] = []
+        if self._previous is not None:
+            previous, self._previous = set(self._previous), None
+            removed = sorted(previous - self._matched)
+            added = [name for name in added if name not in previous]
+        return added, removed
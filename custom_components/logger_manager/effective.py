@@ -0,0 +1,195 @@
+"""Memoized effective-level computation for all loggers."""
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_left, insort
+from collections import Counter
+from collections.abc import Generator
+import heapq
+from itertools import islice
+import logging
+
+from .discovery import DISCOVERY_CHUNK, SliceBudget, drain
+from .tree import _level_name
+
+
+class EffectiveLevelCache:
+    """Effective level of every logger in ``loggerDict``, computed once.
+
+    Names are kept sorted so the descendants of a logger form one contiguous
+    range (``name + "."`` up to ``name + "/"``). Processing that range in
+    order guarantees each ancestor is recomputed before its descendants, so
+    a level change only touches the affected subtree.
+
+    Changes are recorded with ``invalidate`` and applied on the next read,
+    which lets callers invalidate before a logger.* service has actually run.
+
+    A full rebuild (first read, or after ``invalidate()`` of everything)
+    walks all of loggerDict. ``async_refresh`` does it in slices of at most
+    ``slice_budget`` seconds, yielding to the event loop between them;
+    ``refresh`` and the reads do it in one go.
+    """
+
+    def __init__(self, slice_budget: float | None = None) -> None:
+        """Initialize an empty cache."""
+        self.slice_budget = slice_budget
+        self._rebuilding: asyncio.Future | None = None
+        self._scanned = 0
+        self._names: list[str] = []
+        self._effective: dict[str, int] = {}
+        self._counts: Counter[int] = Counter()
+        self._dirty: set[str] = set()
+        self._dirty_all = False
+
+    def invalidate(self, names=None) -> None:
+        """Mark loggers (and their subtrees) for recomputation; None means all."""
+        if names is None:
+            self._dirty_all = True
+        else:
+            self._dirty.update(names)
+
+    def _compute(self, name: str, logger: logging.Logger, effective: dict[str, int] | None = None) -> int:
+        """Return the effective level of a logger using memoized ancestors."""
+        if logger.level:
+            return logger.level
+        if effective is None:
+            effective = self._effective
+        parent = name
+        while parent:
+            parent = parent.rpartition(".")[0]
+            level = effective.get(parent)
+            if level is not None:
+                return level
+        return logging.getLogger().level
+
+    def _set(self, name: str, level: int) -> None:
+        """Store the effective level for a name, keeping the counts in sync."""
+        old = self._effective.get(name)
+        if old == level:
+            return
+        if old is not None:
+            self._counts[old] -= 1
+            if not self._counts[old]:
+                del self._counts[old]
+        self._counts[level] += 1
+        self._effective[name] = level
+
+    def _recompute_subtree(self, name: str, logger_dict: dict) -> None:
+        """Recompute a logger and all of its descendants."""
+        logger = logger_dict.get(name)
+        if isinstance(logger, logging.Logger):
+            if name not in self._effective:
+                # Placeholder that was turned into a logger in place
+                insort(self._names, name)
+            self._set(name, self._compute(name, logger))
+        names = self._names
+        start = bisect_left(names, f"{name}.")
+        end = bisect_left(names, f"{name}/", start)
+        for child in names[start:end]:
+            self._set(child, self._compute(child, logger_dict[child]))
+
+    def needs_rebuild(self, logger_dict: dict | None = None) -> bool:
+        """Return True if the next refresh has to recompute every logger."""
+        if logger_dict is None:
+            logger_dict = logging.Logger.manager.loggerDict
+        return self._dirty_all or not self._scanned or len(logger_dict) < self._scanned
+
+    def _rebuild_steps(self, logger_dict: dict, budget: float | None) -> Generator[None, None, None]:
+        """Recompute every logger from scratch, yielding after each slice of budget seconds.
+
+        Works on a snapshot of loggerDict and replaces the cache in the last
+        step. Invalidations made meanwhile are kept and applied by the next
+        refresh; if the generator is closed early a rebuild is still pending.
+        """
+        self._dirty_all = False
+        self._dirty.clear()
+        slices = SliceBudget(budget)
+        items = list(logger_dict.items())
+        try:
+            runs: list[list[str]] = []
+            for start in range(0, len(items), DISCOVERY_CHUNK):
+                runs.append(sorted(
+                    name for name, logger in items[start:start + DISCOVERY_CHUNK]
+                    if isinstance(name, str) and isinstance(logger, logging.Logger)
+                ))
+                if slices.spent():
+                    yield
+                    slices.restart()
+            names: list[str] = []
+            yield from drain(heapq.merge(*runs), names, slices)
+
+            # Sorted order computes every ancestor before its descendants
+            effective: dict[str, int] = {}
+            for start in range(0, len(names), DISCOVERY_CHUNK):
+                for name in names[start:start + DISCOVERY_CHUNK]:
+                    effective[name] = self._compute(name, logger_dict[name], effective)
+                if slices.spent():
+                    yield
+                    slices.restart()
+        except BaseException:
+            self._dirty_all = True
+            raise
+
+        self._names = names
+        self._effective = effective
+        self._counts = Counter(effective.values())
+        self._scanned = len(items)
+
+    async def async_refresh(self, logger_dict: dict | None = None) -> None:
+        """Like ``refresh``, but run a full rebuild in slices that yield to the event loop.
+
+        Concurrent calls wait for the rebuild already in progress.
+        """
+        if logger_dict is None:
+            logger_dict = logging.Logger.manager.loggerDict
+        if self._rebuilding is not None:
+            await asyncio.shield(self._rebuilding)
+        elif self.needs_rebuild(logger_dict):
+            self._rebuilding = asyncio.get_running_loop().create_future()
+            steps = self._rebuild_steps(logger_dict, self.slice_budget)
+            try:
+                for _ in steps:
+                    await asyncio.sleep(0)
+            finally:
+                steps.close()
+                rebuilding, self._rebuilding = self._rebuilding, None
+                rebuilding.set_result(None)
+        self.refresh(logger_dict)
+
+    def refresh(self, logger_dict: dict | None = None) -> None:
+        """Apply pending invalidations and pick up newly created loggers."""
+        if logger_dict is None:
+            logger_dict = logging.Logger.manager.loggerDict
+
+        if self.needs_rebuild(logger_dict):
+            for _ in self._rebuild_steps(logger_dict, None):
+                pass
+
+        # New names are appended to loggerDict. A placeholder that becomes a
+        # logger in place inherits its parent's level, so it only affects the
+        # counts until it is invalidated or the next full rebuild.
+        new_items = list(islice(logger_dict.items(), self._scanned, None))
+        self._scanned += len(new_items)
+        for name, logger in new_items:
+            if isinstance(name, str) and isinstance(logger, logging.Logger):
+                self._dirty.add(name)
+
+        if self._dirty:
+            dirty, self._dirty = sorted(self._dirty), set()
+            for name in dirty:
+                self._recompute_subtree(name, logger_dict)
+
+    def counts(self, refresh: bool = True) -> dict[str, int]:
+        """Return the number of loggers at each effective level.
+
+        With refresh False the last computed counts are returned as they are.
+        """
+        if refresh:
+            self.refresh()
+        return {_level_name(level): count for level, count in sorted(self._counts.items())}
+
+    def loggers_at(self, level: str) -> list[str]:
+        """Return the sorted names of loggers whose effective level is level."""
+        self.refresh()
+        value = logging.getLevelName(level.upper())
+        return [name for name in self._names if self._effective[name] == value]
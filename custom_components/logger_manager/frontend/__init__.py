@@ -1,13 +1,13 @@
 """Frontend resource registration for Logger Manager."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.lovelace.resources import ResourceStorageCollection
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_call_later
+from homeassistant.core import HomeAssistant
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,7 +15,11 @@ DOMAIN = "logger_manager"
 URL_BASE = f"/hacsfiles/{DOMAIN}"
 CARD_FILENAME = "ha-logger-multiselect-card.js"
 CARD_URL = f"{URL_BASE}/{CARD_FILENAME}"
-CARD_VERSION = "1.0.0"  # Can be updated when card changes
+CARD_VERSION = "1.1.0"  # Can be updated when card changes
+CARD_RESOURCE_URL = f"{CARD_URL}?v={CARD_VERSION}"  # version query busts browser caches
+
+# Seconds to wait for Lovelace to load its resources before giving up
+RESOURCE_LOAD_TIMEOUT = 30
 
 
 class JSModuleRegistration:
@@ -65,45 +69,72 @@ class JSModuleRegistration:
             _LOGGER.debug("Static path already registered: %s", URL_BASE)
 
     async def _async_wait_for_lovelace_resources(self) -> None:
-        """Wait for Lovelace resources to be loaded, then register card."""
-        _LOGGER.debug("Waiting for Lovelace resources to load")
-
-        @callback
-        async def _check_resources_loaded(now) -> None:
-            """Check if Lovelace resources are loaded."""
-            _LOGGER.debug("Checking if Lovelace resources are loaded...")
-            if self.lovelace_data.resources.loaded:
-                _LOGGER.debug("Lovelace resources loaded, proceeding to register card")
-                await self._async_register_card_resource()
-            else:
-                # Resources not loaded yet, check again in 5 seconds
-                _LOGGER.debug("Lovelace resources not loaded yet, will retry in 5 seconds")
-                async_call_later(self.hass, 5, _check_resources_loaded)
-
-        # Start checking
-        await _check_resources_loaded(None)
+        """Let Lovelace load its resources if needed, then register card.
+
+        Runs as a background task, so a slow storage read does not delay setup.
+        """
+        resources: ResourceStorageCollection = self.lovelace_data.resources
+        if not resources.loaded:
+            _LOGGER.debug("Waiting for Lovelace resources to load")
+            try:
+                # Lovelace's own lazy load (it marks the collection loaded);
+                # shielded so a timeout here doesn't cancel Lovelace's load
+                await asyncio.wait_for(
+                    asyncio.shield(resources.async_get_info()), RESOURCE_LOAD_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                _LOGGER.warning(
+                    "Lovelace resources did not load within %s seconds; card resource not "
+                    "registered. Reload the integration or add %s manually via Dashboard Resources.",
+                    RESOURCE_LOAD_TIMEOUT, CARD_RESOURCE_URL
+                )
+                return
+            except Exception as e:
+                _LOGGER.warning(
+                    "Could not load Lovelace resources: %s. Card resource not registered; "
+                    "add %s manually via Dashboard Resources.",
+                    e, CARD_RESOURCE_URL
+                )
+                return
+
+        _LOGGER.debug("Lovelace resources loaded, proceeding to register card")
+        await self._async_register_card_resource()
+
+    @staticmethod
+    def _find_card_resource(resources: ResourceStorageCollection) -> dict | None:
+        """Return our resource entry, matching the URL path with any query string ignored."""
+        by_path = {
+            resource.get("url", "").partition("?")[0]: resource
+            for resource in resources.async_items()
+        }
+        return by_path.get(CARD_URL)
 
     async def _async_register_card_resource(self) -> None:
         """Register the card resource in Lovelace."""
-        _LOGGER.debug("Attempting to register card resource: %s", CARD_URL)
+        _LOGGER.debug("Attempting to register card resource: %s", CARD_RESOURCE_URL)
         try:
             resources: ResourceStorageCollection = self.lovelace_data.resources
-            existing_resources = resources.async_items()
-            _LOGGER.debug("Found %d existing Lovelace resources", len(existing_resources))
+            resource = self._find_card_resource(resources)
 
-            # Check if our resource already exists
-            for resource in existing_resources:
-                if CARD_URL in resource.get("url", ""):
-                    _LOGGER.debug("Card resource already registered: %s", CARD_URL)
+            if resource is not None:
+                if resource.get("url") == CARD_RESOURCE_URL:
+                    _LOGGER.debug("Card resource already registered: %s", CARD_RESOURCE_URL)
                     return
+                # Registered for another card version; point it at this one
+                await resources.async_update_item(resource["id"], {
+                    "res_type": "module",
+                    "url": CARD_RESOURCE_URL,
+                })
+                _LOGGER.info("Updated Logger Manager card resource to %s", CARD_RESOURCE_URL)
+                return
 
             # Resource doesn't exist, create it
-            _LOGGER.debug("Creating new card resource entry for: %s", CARD_URL)
+            _LOGGER.debug("Creating new card resource entry for: %s", CARD_RESOURCE_URL)
             await resources.async_create_item({
                 "res_type": "module",
-                "url": CARD_URL,
+                "url": CARD_RESOURCE_URL,
             })
-            _LOGGER.info("Successfully registered Logger Manager card resource: %s", CARD_URL)
+            _LOGGER.info("Successfully registered Logger Manager card resource: %s", CARD_RESOURCE_URL)
 
         except Exception as e:
             _LOGGER.warning(
@@ -125,14 +156,12 @@ class JSModuleRegistration:
 
         try:
             resources: ResourceStorageCollection = self.lovelace_data.resources
-            existing_resources = resources.async_items()
 
             # Find and remove our resource
-            for resource in existing_resources:
-                if CARD_URL in resource.get("url", ""):
-                    await resources.async_delete_item(resource["id"])
-                    _LOGGER.info("Unregistered Logger Manager card resource")
-                    return
+            resource = self._find_card_resource(resources)
+            if resource is not None:
+                await resources.async_delete_item(resource["id"])
+                _LOGGER.info("Unregistered Logger Manager card resource")
 
         except Exception as e:
             _LOGGER.warning("Could not unregister card resource: %s", e)
@@ -7,17 +7,19 @@ class HaLoggerMultiselectCard extends HTMLElement {
   constructor() {
     super();
     this.attachShadow({ mode: 'open' });
-    this._allLoggers = [];
+    this._totalLoggers = 0;
     this._loading = false;
     this._error = null;
-    this._version = null;
     this._searchQuery = '';
     this._filteredLoggers = [];
+    this._matchTotal = 0;
+    this._searchSeq = 0;
     this._selectedLoggers = new Set();
     this._debounceTimer = null;
     this._focusedIndex = -1;
     this._selectedLevel = 'DEBUG';
     this._logLevels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL', 'NOTSET'];
+    this._maxVisible = 25;
   }
 
   set hass(hass) {
@@ -36,50 +38,51 @@ class HaLoggerMultiselectCard extends HTMLElement {
     this.render();
 
     try {
-      const result = await this._hass.callWS({
-        type: 'logger_manager/get_loggers'
-      });
-      
-      this._allLoggers = result.loggers || [];
-      this._version = result.cache_age || 0;
+      // Initial search (empty query shows all)
+      await this._filterLoggers();
+      this._totalLoggers = this._matchTotal;
       this._loading = false;
       this._error = null;
       
-      // Initial filter (empty query shows all)
-      this._filterLoggers();
-      
-      console.log(`Logger Manager: Loaded ${this._allLoggers.length} loggers`);
+      console.log(`Logger Manager: Loaded ${this._totalLoggers} loggers`);
       
     } catch (error) {
       console.error('Logger Manager: Failed to fetch loggers', error);
       this._loading = false;
       this._error = error.message || 'Failed to load loggers';
-      this._allLoggers = [];
+      this._totalLoggers = 0;
     }
     
     this.render();
   }
 
-  _filterLoggers() {
-    if (!this._allLoggers) {
-      this._filteredLoggers = [];
-      return;
-    }
+  async _filterLoggers() {
+    // Searching happens server-side; only the visible page is transferred.
+    // Already selected loggers are excluded from the results.
+    const seq = ++this._searchSeq;
+    const result = await this._hass.callWS({
+      type: 'logger_manager/search_loggers',
+      query: this._searchQuery.trim(),
+      limit: this._maxVisible,
+      exclude: Array.from(this._selectedLoggers)
+    });
 
-    const query = this._searchQuery.toLowerCase().trim();
-    
-    // Filter based on search query and exclude already selected items
-    let filtered;
-    if (!query) {
-      filtered = [...this._allLoggers];
-    } else {
-      filtered = this._allLoggers.filter(logger => 
-        logger.toLowerCase().includes(query)
-      );
+    // Ignore replies to searches that have since been superseded
+    if (seq !== this._searchSeq) return false;
+    this._filteredLoggers = result.loggers || [];
+    this._matchTotal = result.total || 0;
+    return true;
+  }
+
+  async _refreshResults() {
+    try {
+      if (!(await this._filterLoggers())) return;
+    } catch (error) {
+      console.error('Logger Manager: Logger search failed', error);
+      return;
     }
-    
-    // Exclude already selected loggers from results
-    this._filteredLoggers = filtered.filter(logger => !this._selectedLoggers.has(logger));
+    this._updateMatchCount();
+    this._updateResultsList();
   }
 
   _onSearchInput(event) {
@@ -92,9 +95,7 @@ class HaLoggerMultiselectCard extends HTMLElement {
     
     // Debounce filter execution by 200ms
     this._debounceTimer = setTimeout(() => {
-      this._filterLoggers();
-      this._updateMatchCount();
-      this._updateResultsList();
+      this._refreshResults();
       this._focusedIndex = -1; // Reset focus when results change
     }, 200);
   }
@@ -102,7 +103,7 @@ class HaLoggerMultiselectCard extends HTMLElement {
   _updateMatchCount() {
     const matchCountElement = this.shadowRoot?.querySelector('.match-count');
     if (matchCountElement) {
-      matchCountElement.textContent = `${this._filteredLoggers.length} matches`;
+      matchCountElement.textContent = `${this._matchTotal} matches`;
     }
   }
 
@@ -111,7 +112,7 @@ class HaLoggerMultiselectCard extends HTMLElement {
     if (!resultsContainer) return;
 
     // Show up to 25 items to accommodate more sub-loggers
-    const maxVisible = Math.min(25, this._filteredLoggers.length);
+    const maxVisible = Math.min(this._maxVisible, this._filteredLoggers.length);
     
     resultsContainer.innerHTML = this._filteredLoggers.slice(0, maxVisible).map((logger, index) => `
       <div class="result-item" data-logger="${logger}" data-index="${index}" tabindex="0">
@@ -119,10 +120,10 @@ class HaLoggerMultiselectCard extends HTMLElement {
       </div>
     `).join('');
 
-    if (this._filteredLoggers.length > maxVisible) {
+    if (this._matchTotal > maxVisible) {
       resultsContainer.innerHTML += `
         <div class="more-results">
-          ... and ${this._filteredLoggers.length - maxVisible} more (scroll or narrow search)
+          ... and ${this._matchTotal - maxVisible} more (narrow your search)
         </div>
       `;
     }
@@ -142,10 +143,8 @@ class HaLoggerMultiselectCard extends HTMLElement {
     this._selectedLoggers.add(loggerName);
 
     // Re-filter to remove selected items from results
-    this._filterLoggers();
-    this._updateMatchCount();
-    this._updateResultsList();
     this._updateSelectionArea();
+    this._refreshResults();
   }
 
   _onChipRemove(loggerName) {
@@ -153,10 +152,8 @@ class HaLoggerMultiselectCard extends HTMLElement {
     this._selectedLoggers.delete(loggerName);
 
     // Re-filter to add item back to results
-    this._filterLoggers();
-    this._updateMatchCount();
-    this._updateResultsList();
     this._updateSelectionArea();
+    this._refreshResults();
   }
 
   _onClearAll() {
@@ -164,10 +161,8 @@ class HaLoggerMultiselectCard extends HTMLElement {
     this._selectedLoggers.clear();
 
     // Re-filter to show all items again
-    this._filterLoggers();
-    this._updateMatchCount();
-    this._updateResultsList();
     this._updateSelectionArea();
+    this._refreshResults();
   }
 
   _onLevelChange(event) {
@@ -309,8 +304,8 @@ class HaLoggerMultiselectCard extends HTMLElement {
     } else if (this._error) {
       statusContent = `Error: ${this._error}`;
       statusClass = 'error';
-    } else if (this._allLoggers.length > 0) {
-      statusContent = `Loaded ${this._allLoggers.length} loggers`;
+    } else if (this._totalLoggers > 0) {
+      statusContent = `Loaded ${this._totalLoggers} loggers`;
       statusClass = 'success';
     } else {
       statusContent = 'No loggers found';
@@ -318,8 +313,8 @@ class HaLoggerMultiselectCard extends HTMLElement {
     }
 
     // Show search input and match count if data is loaded
-    const showSearch = !this._loading && !this._error && this._allLoggers.length > 0;
-    const matchCount = showSearch ? this._filteredLoggers.length : 0;
+    const showSearch = !this._loading && !this._error && this._totalLoggers > 0;
+    const matchCount = showSearch ? this._matchTotal : 0;
 
     this.shadowRoot.innerHTML = `
       <style>
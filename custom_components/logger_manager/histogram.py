@@ -0,0 +1,79 @@
+"""Fixed-size latency histogram for Logger Manager."""
+from __future__ import annotations
+
+# Log-scale buckets: each power of two is split into 4 sub-buckets (~19%
+# resolution). Bucket 0 holds everything under 2**_MIN_BITS ns, the last
+# bucket everything from 2**_MAX_BITS ns (~69 s) upwards.
+_SUB_BITS = 2
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MIN_BITS = 7
+_MAX_BITS = 36
+_BUCKETS = (_MAX_BITS - _MIN_BITS) * _SUB_BUCKETS + 1
+
+
+def _bucket(ns: int) -> int:
+    """Return the bucket index of a duration in nanoseconds."""
+    bits = ns.bit_length()
+    if bits <= _MIN_BITS:
+        return 0
+    sub = (ns >> (bits - 1 - _SUB_BITS)) & (_SUB_BUCKETS - 1)
+    return min((bits - 1 - _MIN_BITS) * _SUB_BUCKETS + sub + 1, _BUCKETS - 1)
+
+
+def _upper_bound(index: int) -> int:
+    """Return the exclusive upper bound in nanoseconds of a bucket."""
+    if index == 0:
+        return 1 << _MIN_BITS
+    octave, sub = divmod(index - 1, _SUB_BUCKETS)
+    shift = octave + _MIN_BITS - _SUB_BITS
+    return (_SUB_BUCKETS + sub + 1) << shift
+
+
+class LatencyHistogram:
+    """Count durations in a fixed number of log-scale buckets.
+
+    Memory does not grow with the number of samples. Percentiles are
+    reported as the upper bound of the bucket they fall in (capped at the
+    largest sample seen), so they are accurate to within one bucket.
+    """
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets = [0] * _BUCKETS
+
+    def add(self, ns: int) -> None:
+        """Record one duration in nanoseconds."""
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+        self.buckets[_bucket(ns)] += 1
+
+    def percentile(self, q: float) -> int:
+        """Return the approximate q-th percentile (0-100) in nanoseconds."""
+        if not self.count:
+            return 0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(_upper_bound(index), self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Return count, total and summary percentiles in microseconds."""
+        return {
+            "count": self.count,
+            "total_ms": round(self.total / 1e6, 3),
+            "mean_us": round(self.total / self.count / 1e3, 2) if self.count else 0,
+            "p50_us": round(self.percentile(50) / 1e3, 2),
+            "p90_us": round(self.percentile(90) / 1e3, 2),
+            "p99_us": round(self.percentile(99) / 1e3, 2),
+            "max_us": round(self.max / 1e3, 2),
+        }
@@ -0,0 +1,205 @@
+"""Append-only journal of managed logger level changes."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import json
+import logging
+import os
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "logger_manager_journal.jsonl"
+JOURNAL_MAX_ENTRIES = 1000
+JOURNAL_MAX_AGE = 7 * 24 * 3600  # seconds
+JOURNAL_COMPACT_EVERY = 200  # entries between state snapshots
+
+SOURCE_SERVICE = "service"
+SOURCE_EXPIRY = "expiry"
+SOURCE_RESTORE = "restore"
+SOURCE_CLEANUP = "cleanup"  # sensor removed loggers set to the default level
+
+
+def _read_lines(path: str) -> list[dict]:
+    """Read journal entries from disk, skipping a torn or corrupt line."""
+    entries = []
+    try:
+        with open(path, encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return entries
+
+
+def _append_lines(path: str, lines: list[str]) -> None:
+    """Append encoded entries to the journal file."""
+    with open(path, "a", encoding="utf-8") as journal:
+        journal.writelines(lines)
+
+
+def _rewrite_lines(path: str, lines: list[str]) -> None:
+    """Atomically replace the journal file with the given entries."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as journal:
+        journal.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+def _encode(entry: dict) -> str:
+    """Return one journal line."""
+    return json.dumps(entry, separators=(",", ":")) + "\n"
+
+
+class ChangeJournal:
+    """Record every managed level change as one appended JSON line.
+
+    Each entry is {"seq", "ts", "source", "changes": [{"logger", "old",
+    "new"}]}; None stands for "not managed" (the default level). Entries
+    that only record an event, such as a startup restore, carry a
+    "summary" dict and no changes, and are not replayed. Writes run
+    in the executor and only append the new lines, so their cost depends on
+    the size of the change, not on the number of managed loggers.
+
+    The state snapshot in the Store records the last sequence number it
+    includes; entries after it are replayed on load. Once a snapshot has
+    been saved (``async_compact``), entries it covers may be dropped beyond
+    ``max_entries`` or ``max_age`` and the file is rewritten without them.
+    Entries not yet covered by a snapshot are never dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        max_entries: int = JOURNAL_MAX_ENTRIES,
+        max_age: float = JOURNAL_MAX_AGE,
+    ) -> None:
+        """Initialize an empty journal."""
+        self.hass = hass
+        self.path = path
+        self.seq = 0
+        self.compacted_seq = 0
+        self._max_entries = max_entries
+        self._max_age = max_age
+        self._entries: deque[dict] = deque()
+        self._file_lines = 0
+        self._pending: list[str] = []
+        self._lock = asyncio.Lock()
+        self._writer: asyncio.Task | None = None
+
+    @property
+    def uncompacted(self) -> int:
+        """Return the number of entries not yet covered by a state snapshot."""
+        return self.seq - self.compacted_seq
+
+    async def async_load(self, compacted_seq: int = 0) -> None:
+        """Read the journal file; compacted_seq is the snapshot's sequence number."""
+        entries = await self.hass.async_add_executor_job(_read_lines, self.path)
+        self._entries = deque(entry for entry in entries if "seq" in entry)
+        self._file_lines = len(entries)
+        self.compacted_seq = compacted_seq
+        self.seq = max(self._entries[-1]["seq"] if self._entries else 0, compacted_seq)
+
+    def entries_since(self, seq: int) -> list[dict]:
+        """Return the entries with level changes recorded after a sequence number, oldest first."""
+        return [entry for entry in self._entries if entry["seq"] > seq and entry["changes"]]
+
+    @callback
+    def record(self, source: str, changes: list[dict], summary: dict | None = None) -> dict | None:
+        """Append an entry for a list of {"logger", "old", "new"} changes and/or a summary."""
+        if not changes and not summary:
+            return None
+        self.seq += 1
+        entry = {"seq": self.seq, "ts": round(time.time(), 3), "source": source, "changes": changes}
+        if summary:
+            entry["summary"] = summary
+        self._entries.append(entry)
+        self._pending.append(_encode(entry))
+        self._prune()
+        if self._writer is None or self._writer.done():
+            self._writer = self.hass.async_create_background_task(
+                self._async_write(), "logger_manager journal write"
+            )
+        return entry
+
+    def _prune(self) -> None:
+        """Drop compacted entries beyond the size or age bound (memory only)."""
+        entries = self._entries
+        cutoff = time.time() - self._max_age
+        while (
+            entries
+            and entries[0]["seq"] <= self.compacted_seq
+            and (len(entries) > self._max_entries or entries[0]["ts"] < cutoff)
+        ):
+            entries.popleft()
+
+    async def _async_write(self) -> None:
+        """Append pending lines until none are left."""
+        async with self._lock:
+            while self._pending:
+                lines, self._pending = self._pending, []
+                try:
+                    await self.hass.async_add_executor_job(_append_lines, self.path, lines)
+                    self._file_lines += len(lines)
+                except OSError as e:
+                    _LOGGER.error(f"Failed to append to logger change journal: {e}")
+
+    async def async_flush(self) -> None:
+        """Wait until every recorded entry is on disk."""
+        if self._writer is not None:
+            await self._writer
+        if self._pending:
+            await self._async_write()
+
+    async def async_compact(self, seq: int) -> None:
+        """Mark entries up to seq as covered by a snapshot and trim the file."""
+        self.compacted_seq = max(self.compacted_seq, seq)
+        self._prune()
+        async with self._lock:
+            if self._file_lines <= len(self._entries):
+                return
+            # Pending lines are part of the rewrite
+            pending, self._pending = self._pending, []
+            lines = [_encode(entry) for entry in self._entries]
+            try:
+                await self.hass.async_add_executor_job(_rewrite_lines, self.path, lines)
+                self._file_lines = len(lines)
+                _LOGGER.debug(f"Compacted logger change journal to {len(lines)} entries")
+            except OSError as e:
+                self._pending = pending + self._pending
+                _LOGGER.error(f"Failed to compact logger change journal: {e}")
+
+    def history(
+        self,
+        limit: int,
+        before: int | None = None,
+        logger: str | None = None,
+        source: str | None = None,
+    ) -> list[dict]:
+        """Return up to limit entries, newest first, optionally filtered.
+
+        ``before`` pages backwards: only entries with a lower seq are returned.
+        Filtering by logger keeps only that logger's changes in each entry.
+        """
+        result = []
+        for entry in reversed(self._entries):
+            if before is not None and entry["seq"] >= before:
+                continue
+            if source is not None and entry["source"] != source:
+                continue
+            if logger is not None:
+                changes = [change for change in entry["changes"] if change["logger"] == logger]
+                if not changes:
+                    continue
+                entry = {**entry, "changes": changes}
+            result.append(entry)
+            if len(result) >= limit:
+                break
+        return result
@@ -0,0 +1,86 @@
+"""Diff-aware, batched application of logger levels for Logger Manager."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+APPLY_BATCH_WINDOW = 0.05  # seconds to wait for concurrent calls to merge
+
+
+def level_is_current(name: str, level: str) -> bool:
+    """Return True if an existing logger already has exactly this level set.
+
+    Loggers that do not exist yet are never current; HA's logger service
+    still has to record an override for them.
+    """
+    logger = logging.Logger.manager.loggerDict.get(name)
+    if not isinstance(logger, logging.Logger):
+        return False
+    return logger.level == logging.getLevelName(level.upper())
+
+
+def managed_digest(managed_loggers: dict[str, str]) -> str:
+    """Return a short, order-independent digest of a managed {logger: level} mapping."""
+    encoded = json.dumps(managed_loggers, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:12]
+
+
+class LevelApplier:
+    """Send only real level changes to logger.set_level, batching concurrent calls.
+
+    Requests are compared against the logger's current level (or a change
+    already queued in the open batch) and no-ops are skipped. Changes that
+    arrive within ``window`` seconds of each other are merged into a single
+    logger.set_level call; for the same logger the most recent request wins.
+    """
+
+    def __init__(self, hass: HomeAssistant, window: float = APPLY_BATCH_WINDOW) -> None:
+        """Initialize the applier."""
+        self.hass = hass
+        self._window = window
+        self._pending: dict[str, str] = {}
+        self._future: asyncio.Future | None = None
+
+    async def async_apply(self, mapping: dict[str, str]) -> tuple[list[str], list[str]]:
+        """Apply a logger name -> level mapping.
+
+        Returns the (changed, skipped) logger names.
+        """
+        changed: list[str] = []
+        skipped: list[str] = []
+        for name, level in mapping.items():
+            if name not in self._pending and level_is_current(name, level):
+                skipped.append(name)
+                continue
+            changed.append(name)
+            self._pending[name] = level
+
+        if changed:
+            if self._future is None:
+                self._future = self.hass.loop.create_future()
+                async_call_later(self.hass, self._window, self._async_flush)
+            # Shield so one cancelled caller does not fail the whole batch
+            await asyncio.shield(self._future)
+
+        return changed, skipped
+
+    async def _async_flush(self, _now=None) -> None:
+        """Send the merged batch to logger.set_level."""
+        mapping, self._pending = self._pending, {}
+        future, self._future = self._future, None
+        try:
+            await self.hass.services.async_call("logger", "set_level", mapping, blocking=True)
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+            # Retrieve the exception so an unawaited batch does not log a warning
+            future.exception()
+        else:
+            _LOGGER.debug(f"Applied batch of {len(mapping)} logger level change(s)")
+            future.set_result(len(mapping))
@@ -0,0 +1,111 @@
+"""Compiled logger name matcher for Logger Manager discovery."""
+from __future__ import annotations
+
+import fnmatch
+import re
+import time
+
+_GLOB_CHARS = frozenset("*?[")
+_TERMINAL = ""  # trie key marking the end of a literal prefix
+
+
+def is_literal(pattern: str) -> bool:
+    """Return True if the pattern contains no glob wildcards."""
+    return not _GLOB_CHARS.intersection(pattern)
+
+
+def wildcard_count(pattern: str) -> int:
+    """Return the number of glob wildcards in the pattern."""
+    return sum(1 for ch in pattern if ch in _GLOB_CHARS)
+
+
+class LoggerMatcher:
+    """Match logger names against a fixed list of glob patterns in one pass.
+
+    Patterns are split into three groups when the matcher is built:
+    - literal names (``asyncio``) go into a set for O(1) lookup
+    - trailing-star prefixes (``homeassistant*``) go into a character trie
+    - everything else is translated and joined into one combined regex
+
+    Build one matcher per pattern fingerprint and reuse it; ``match`` is then
+    a single pass over the name regardless of how many patterns there are.
+    """
+
+    def __init__(self, patterns: list[str], fingerprint: str | None = None) -> None:
+        """Compile the given patterns."""
+        self.patterns = list(patterns)
+        self.fingerprint = fingerprint
+        self._exact: set[str] = set()
+        self._trie: dict = {}
+        globs: list[str] = []
+
+        for p in self.patterns:
+            if not p:
+                continue
+            if is_literal(p):
+                self._exact.add(p)
+            elif p.endswith("*") and is_literal(p[:-1]):
+                self._add_prefix(p[:-1])
+            else:
+                globs.append(fnmatch.translate(p))
+
+        self._regex = re.compile("|".join(globs)) if globs else None
+
+    def _add_prefix(self, prefix: str) -> None:
+        """Insert a literal prefix into the trie."""
+        node = self._trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node[_TERMINAL] = True
+
+    def _match_prefix(self, name: str) -> bool:
+        """Return True if any stored prefix is a prefix of name."""
+        node = self._trie
+        if not node:
+            return False
+        if _TERMINAL in node:
+            return True
+        for ch in name:
+            node = node.get(ch)
+            if node is None:
+                return False
+            if _TERMINAL in node:
+                return True
+        return False
+
+    def match(self, name: str) -> bool:
+        """Return True if name matches any of the compiled patterns."""
+        if name in self._exact or self._match_prefix(name):
+            return True
+        return self._regex is not None and self._regex.match(name) is not None
+
+    def filter(self, names) -> list[str]:
+        """Return the names matched by this matcher, in input order."""
+        return [name for name in names if self.match(name)]
+
+
+def pattern_report(patterns: list[str], names: list[str], builtin: list[str]) -> list[dict]:
+    """Return the match count, wildcards, matching time and redundancy of each pattern.
+
+    A pattern is redundant if the built-in patterns already match it (for a
+    literal name) or every logger it matches (for a glob).
+    """
+    builtin_matcher = LoggerMatcher(builtin)
+    report = []
+    for pattern in patterns:
+        matcher = LoggerMatcher([pattern])
+        start = time.perf_counter()
+        matched = matcher.filter(names)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if is_literal(pattern):
+            redundant = builtin_matcher.match(pattern)
+        else:
+            redundant = bool(matched) and all(builtin_matcher.match(name) for name in matched)
+        report.append({
+            "pattern": pattern,
+            "matches": len(matched),
+            "wildcards": wildcard_count(pattern),
+            "ms": round(elapsed_ms, 2),
+            "redundant": redundant,
+        })
+    return report
@@ -0,0 +1,92 @@
+"""In-memory metrics for Logger Manager's own hot paths."""
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+import time
+
+from .histogram import LatencyHistogram
+
+
+class _SizeStats:
+    """Count, total, max and last value of an observed size."""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self) -> None:
+        """Initialize empty stats."""
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.last = 0
+
+    def add(self, value: int) -> None:
+        """Record one value."""
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    def as_dict(self) -> dict:
+        """Return the stats with the mean."""
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else 0,
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+class Metrics:
+    """Counters, duration histograms and size stats keyed by metric name.
+
+    Every metric is a fixed-size object created on first use and the set of
+    names is fixed by the code, so memory stays bounded. Recording is a dict
+    lookup plus a few integer operations.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.since = datetime.now().isoformat()
+        self._counters: Counter[str] = Counter()
+        self._timings: dict[str, LatencyHistogram] = {}
+        self._sizes: dict[str, _SizeStats] = {}
+
+    def incr(self, name: str, count: int = 1) -> None:
+        """Increment a counter."""
+        self._counters[name] += count
+
+    def observe(self, name: str, ns: int) -> None:
+        """Record a duration in nanoseconds."""
+        histogram = self._timings.get(name)
+        if histogram is None:
+            histogram = self._timings[name] = LatencyHistogram()
+        histogram.add(ns)
+
+    def size(self, name: str, value: int) -> None:
+        """Record a size (bytes, items)."""
+        stats = self._sizes.get(name)
+        if stats is None:
+            stats = self._sizes[name] = _SizeStats()
+        stats.add(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of the enclosed block."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter_ns() - start)
+
+    def as_dict(self) -> dict:
+        """Return every metric in a serializable form."""
+        return {
+            "since": self.since,
+            "counters": dict(sorted(self._counters.items())),
+            "timings": {name: hist.as_dict() for name, hist in sorted(self._timings.items())},
+            "sizes": {name: stats.as_dict() for name, stats in sorted(self._sizes.items())},
+        }
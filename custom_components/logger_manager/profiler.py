@@ -0,0 +1,83 @@
+"""Opt-in logging-cost profiler for Logger Manager."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+import time
+
+from .histogram import LatencyHistogram
+
+PROFILE_MAX_LOGGERS = 100  # bound on the number of profiled loggers
+
+
+class LoggingProfiler:
+    """Measure the wall-clock time each profiled logger spends handling records.
+
+    Profiling replaces ``handle`` on the logger instance with a timing
+    wrapper, so it covers filters plus every handler the record reaches
+    (formatting and emit, including handlers of ancestors it propagates to).
+    Only records created by the profiled logger itself are measured; a
+    child logger's records are handled by the child. Handlers that queue
+    records for another thread are measured up to the hand-off.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an inactive profiler."""
+        self.started: str | None = None
+        self.stopped: str | None = None
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._wrappers: dict[str, object] = {}
+
+    @property
+    def active(self) -> bool:
+        """Return True while loggers are being profiled."""
+        return bool(self._wrappers)
+
+    def _wrap(self, name: str, histogram: LatencyHistogram) -> None:
+        """Install the timing wrapper on one logger."""
+        logger = logging.getLogger(name)
+        original = logger.handle
+        add = histogram.add
+        perf_counter_ns = time.perf_counter_ns
+
+        def handle(record: logging.LogRecord):
+            start = perf_counter_ns()
+            try:
+                return original(record)
+            finally:
+                add(perf_counter_ns() - start)
+
+        logger.handle = handle
+        self._wrappers[name] = handle
+
+    def start(self, names: list[str]) -> None:
+        """Start profiling the given loggers, replacing any previous run."""
+        self.stop()
+        self._histograms = {name: LatencyHistogram() for name in names[:PROFILE_MAX_LOGGERS]}
+        for name, histogram in self._histograms.items():
+            self._wrap(name, histogram)
+        self.started = datetime.now().isoformat()
+        self.stopped = None
+
+    def stop(self) -> None:
+        """Remove the timing wrappers; collected timings stay readable."""
+        for name, wrapper in self._wrappers.items():
+            logger = logging.getLogger(name)
+            # Only undo our own wrapper; leave anything installed on top of it
+            if logger.__dict__.get("handle") is wrapper:
+                del logger.handle
+        if self._wrappers:
+            self.stopped = datetime.now().isoformat()
+        self._wrappers = {}
+
+    def stats(self) -> dict:
+        """Return per-logger timing summaries, costliest first."""
+        loggers = sorted(
+            self._histograms.items(), key=lambda item: item[1].total, reverse=True
+        )
+        return {
+            "active": self.active,
+            "started": self.started,
+            "stopped": self.stopped,
+            "loggers": {name: histogram.as_dict() for name, histogram in loggers},
+        }
@@ -0,0 +1,126 @@
+"""Central scheduler for time-boxed logger levels."""
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+import heapq
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Expirations due within this many seconds of each other are reverted together
+EXPIRY_GRACE = 0.5
+
+
+class ExpiryScheduler:
+    """Revert time-boxed logger levels when they expire.
+
+    All expirations live in one heap of (deadline, name) and only the
+    earliest one has an armed timer, so thousands of entries cost one timer.
+    Rescheduling or cancelling an entry leaves its old heap item in place;
+    stale items are skipped when they reach the top.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        on_expired: Callable[[dict[str, str]], Awaitable[None]],
+    ) -> None:
+        """Initialize the scheduler.
+
+        on_expired receives a {logger name: level to revert to} mapping.
+        """
+        self.hass = hass
+        self._on_expired = on_expired
+        self._heap: list[tuple[float, str]] = []
+        self._entries: dict[str, tuple[float, str]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_for: float | None = None
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if the logger has a pending expiration."""
+        return name in self._entries
+
+    def revert_level(self, name: str) -> str | None:
+        """Return the level a pending expiration will revert to."""
+        entry = self._entries.get(name)
+        return entry[1] if entry else None
+
+    @callback
+    def schedule(self, name: str, expires: float, revert_to: str) -> None:
+        """Revert a logger to revert_to at the given epoch time."""
+        self._entries[name] = (expires, revert_to)
+        heapq.heappush(self._heap, (expires, name))
+        self._arm()
+
+    @callback
+    def cancel(self, name: str) -> None:
+        """Drop a pending expiration (its heap item is discarded lazily)."""
+        if self._entries.pop(name, None) is not None:
+            self._arm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Disarm the timer; pending entries are kept for persistence."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+            self._armed_for = None
+
+    def _peek(self) -> float | None:
+        """Return the earliest live deadline, dropping stale heap items."""
+        heap, entries = self._heap, self._entries
+        while heap:
+            deadline, name = heap[0]
+            entry = entries.get(name)
+            if entry is not None and entry[0] == deadline:
+                return deadline
+            heapq.heappop(heap)
+        return None
+
+    @callback
+    def _arm(self) -> None:
+        """Make sure the single timer fires for the earliest deadline."""
+        deadline = self._peek()
+        if deadline == self._armed_for:
+            return
+        self.async_stop()
+        if deadline is not None:
+            self._armed_for = deadline
+            self._unsub = async_call_later(self.hass, max(0.0, deadline - time.time()), self._async_fire)
+
+    async def _async_fire(self, _now=None) -> None:
+        """Revert every expiration that is due, then re-arm for the next one."""
+        self._unsub = None
+        self._armed_for = None
+        due: dict[str, str] = {}
+        limit = time.time() + EXPIRY_GRACE
+        while (deadline := self._peek()) is not None and deadline <= limit:
+            _, name = heapq.heappop(self._heap)
+            due[name] = self._entries.pop(name)[1]
+        self._arm()
+
+        if due:
+            _LOGGER.debug(f"Reverting {len(due)} time-boxed logger level(s)")
+            try:
+                await self._on_expired(due)
+            except Exception as e:
+                _LOGGER.error(f"Failed to revert expired logger levels: {e}")
+
+    def expiring(self) -> dict[str, dict]:
+        """Return the expiry time and revert level of every pending entry."""
+        return {
+            name: {"expires_at": datetime.fromtimestamp(expires).isoformat(), "revert_to": revert_to}
+            for name, (expires, revert_to) in sorted(self._entries.items())
+        }
+
+    def settings(self) -> dict[str, dict]:
+        """Return the pending expirations in their persisted form."""
+        return {
+            name: {"expires": expires, "revert_to": revert_to}
+            for name, (expires, revert_to) in sorted(self._entries.items())
+        }
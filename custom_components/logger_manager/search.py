@@ -0,0 +1,110 @@
+"""Server-side logger search index for Logger Manager."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+import fnmatch
+import re
+
+SEARCH_MODES = ["substring", "prefix", "glob"]
+_RESULT_CACHE_SIZE = 32  # recent (mode, query) results kept for paging
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob before its first wildcard."""
+    match = re.search(r"[*?\[]", pattern)
+    return pattern[:match.start()] if match else pattern
+
+
+class LoggerSearchIndex:
+    """Case-insensitive search over a fixed list of logger names.
+
+    Names are kept sorted by their lowercase form so prefix queries are a
+    pair of bisects. Substring queries run ``str.find`` over one joined
+    text buffer and map hits back to names through the line start offsets.
+    Results are cached per (mode, query) so paging through them is cheap.
+    """
+
+    def __init__(self, loggers: list[str]) -> None:
+        """Build the index for the given logger names."""
+        pairs = sorted((name.lower(), name) for name in loggers)
+        self._keys = [key for key, _ in pairs]
+        self._names = [name for _, name in pairs]
+        self._text = "\n".join(self._keys)
+        self._starts: list[int] = []
+        pos = 0
+        for key in self._keys:
+            self._starts.append(pos)
+            pos += len(key) + 1
+        self._results: OrderedDict[tuple[str, str], range | list[int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self._names)
+
+    def _prefix_range(self, prefix: str) -> range:
+        """Return the index range of keys starting with prefix."""
+        if not prefix:
+            return range(len(self._keys))
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_right(self._keys, prefix + "\uffff", lo)
+        return range(lo, hi)
+
+    def _substring(self, query: str) -> list[int]:
+        """Return the indices of keys containing query."""
+        starts, find = self._starts, self._text.find
+        hits: list[int] = []
+        pos = find(query)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            hits.append(idx)
+            if idx + 1 >= len(starts):
+                break
+            # Continue from the next name so each name is reported once
+            pos = find(query, starts[idx + 1])
+        return hits
+
+    def _glob(self, pattern: str) -> list[int]:
+        """Return the indices of keys matching a glob pattern."""
+        regex = re.compile(fnmatch.translate(pattern))
+        keys = self._keys
+        return [i for i in self._prefix_range(_literal_prefix(pattern)) if regex.match(keys[i])]
+
+    def search(self, query: str, mode: str = "substring") -> range | list[int]:
+        """Return the sorted indices of names matching query in the given mode."""
+        query = query.strip().lower()
+        if not query:
+            return range(len(self._keys))
+
+        cache_key = (mode, query)
+        results = self._results.get(cache_key)
+        if results is not None:
+            self._results.move_to_end(cache_key)
+            return results
+
+        if mode == "prefix":
+            results = self._prefix_range(query)
+        elif mode == "glob":
+            results = self._glob(query)
+        else:
+            results = self._substring(query)
+
+        self._results[cache_key] = results
+        if len(self._results) > _RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return results
+
+    def page(
+        self,
+        query: str,
+        mode: str = "substring",
+        offset: int = 0,
+        limit: int = 50,
+        exclude: set[str] | None = None,
+    ) -> tuple[list[str], int]:
+        """Return one page of matching names and the total match count."""
+        results = self.search(query, mode)
+        names = self._names
+        if exclude:
+            results = [i for i in results if names[i] not in exclude]
+        return [names[i] for i in results[offset:offset + limit]], len(results)
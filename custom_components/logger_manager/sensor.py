@@ -1,20 +1,34 @@
 """Logger Manager sensor platform."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CALL_SERVICE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import SIGNAL_LEVELS_UPDATED
+from .journal import SOURCE_CLEANUP
+from .levels import managed_digest
+from .volume import VOLUME_TOP_N, LogVolumeHandler
+
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(seconds=10)
 DOMAIN = "logger"  # built-in HA logger integration
 LOGGER_MANAGER_DOMAIN = "logger_manager"  # our integration domain
 
+# logger.* service calls fire before the service runs; refresh shortly after
+LOGGER_SERVICE_DEBOUNCE = 0.5
+
+# Only polled entity is the Noisiest Loggers sensor (rates change continuously)
+SCAN_INTERVAL = timedelta(seconds=30)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,24 +37,93 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Logger Manager sensor from a config entry."""
     _LOGGER.debug("Setting up Logger Manager sensor platform")
-    async_add_entities([LoggerInspectorSensor(hass)], True)
+    entities: list[SensorEntity] = [LoggerInspectorSensor(hass)]
+    volume_handler = hass.data[LOGGER_MANAGER_DOMAIN].get("volume_handler")
+    if volume_handler is not None:
+        entities.append(LogVolumeSensor(volume_handler))
+    async_add_entities(entities)
 
 
 class LoggerInspectorSensor(SensorEntity):
-    """Sensor that exposes Home Assistant logger state."""
+    """Sensor that exposes Home Assistant logger state.
+
+    The sensor does not poll. It refreshes when apply_levels changes managed
+    loggers and shortly after any logger.* service call (overrides or the
+    default level changed).
+    """
 
     _attr_name = "Logger Levels"
     _attr_icon = "mdi:file-document-alert"
-    _attr_should_poll = True
+    _attr_should_poll = False
+    # Detail attributes change often and can be large; keep them out of the recorder
+    _unrecorded_attributes = frozenset({
+        "managed_loggers",
+        "effective_level_counts",
+        "throttled_loggers",
+        "expiring_loggers",
+    })
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the sensor."""
         self.hass = hass
+        self._rebuild_task: asyncio.Task | None = None
         # Data structure is already initialized by __init__.py async_setup_entry()
         # No need to defensively initialize here
 
-    def update(self) -> None:
-        """Update the sensor state."""
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to level changes and compute the initial state."""
+        debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=LOGGER_SERVICE_DEBOUNCE,
+            immediate=False,
+            function=self._async_refresh,
+        )
+
+        @callback
+        def _logger_service_called(event: Event) -> None:
+            if event.data.get("domain") == DOMAIN:
+                debouncer.async_schedule_call()
+
+        @callback
+        def _levels_updated(changed: dict[str, str], removed: list[str], throttled: dict) -> None:
+            self._async_refresh()
+
+        self.async_on_remove(self.hass.bus.async_listen(EVENT_CALL_SERVICE, _logger_service_called))
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_LEVELS_UPDATED, _levels_updated))
+        self.async_on_remove(debouncer.async_cancel)
+        self.async_on_remove(self._async_cancel_rebuild)
+
+        self._update_state()
+
+    @callback
+    def _async_refresh(self) -> None:
+        """Recompute the state and write it."""
+        metrics = self.hass.data.get(LOGGER_MANAGER_DOMAIN, {}).get("metrics")
+        if metrics is not None:
+            metrics.incr("sensor_updates")
+        cleaned = self._update_state()
+        self.async_write_ha_state()
+        if cleaned:
+            async_dispatcher_send(self.hass, SIGNAL_LEVELS_UPDATED, {}, cleaned, {})
+
+    async def _async_rebuild_effective(self, effective_levels) -> None:
+        """Rebuild the effective levels without blocking the loop, then update the state."""
+        await effective_levels.async_refresh()
+        if self.entity_id is not None:
+            self._async_refresh()
+
+    @callback
+    def _async_cancel_rebuild(self) -> None:
+        """Stop a pending effective-level rebuild."""
+        if self._rebuild_task is not None:
+            self._rebuild_task.cancel()
+
+    def _update_state(self) -> list[str]:
+        """Update the sensor state.
+
+        Returns the managed loggers removed by auto-cleanup.
+        """
         data = self.hass.data.get(DOMAIN)
 
         if data is None:
@@ -54,7 +137,7 @@ class LoggerInspectorSensor(SensorEntity):
                 "last_updated": None,
                 "error": "Logger data not found"
             }
-            return
+            return []
 
         try:
             # LoggerDomainConfig has:
@@ -83,18 +166,41 @@ class LoggerInspectorSensor(SensorEntity):
                 if level.lower() != default_str:
                     cleaned_managed[logger_name] = level
 
-            # Update managed loggers if cleanup occurred
-            if len(cleaned_managed) != len(managed_loggers):
-                self.hass.data[LOGGER_MANAGER_DOMAIN]["managed_loggers"] = cleaned_managed
-                managed_loggers = cleaned_managed
+            # Update managed loggers if cleanup occurred; in place, so callers
+            # holding a reference to the mapping keep seeing the live one
+            cleaned = [name for name in managed_loggers if name not in cleaned_managed]
+            if cleaned:
+                journal = managed_data.get("journal")
+                if journal is not None:
+                    journal.record(SOURCE_CLEANUP, [
+                        {"logger": name, "old": managed_loggers[name], "new": None} for name in cleaned
+                    ])
+                for name in cleaned:
+                    del managed_loggers[name]
+
+            effective_levels = managed_data.get("effective_levels")
+            rebuild = effective_levels is not None and effective_levels.needs_rebuild()
+            if rebuild and (self._rebuild_task is None or self._rebuild_task.done()):
+                # Rebuild in slices in the background and update again when done;
+                # until then the last computed counts are shown
+                self._rebuild_task = self.hass.async_create_background_task(
+                    self._async_rebuild_effective(effective_levels), "logger_manager effective levels"
+                )
+            throttles = managed_data.get("throttles")
+            expirations = managed_data.get("expirations")
 
             self._attr_native_value = default_str
             self._attr_extra_state_attributes = {
                 "default": default_str,
-                "managed_loggers": dict(sorted(managed_loggers.items())),
                 "managed_count": len(managed_loggers),
+                "managed_hash": managed_digest(managed_loggers),
+                "managed_loggers": dict(sorted(managed_loggers.items())),
+                "effective_level_counts": effective_levels.counts(refresh=not rebuild) if effective_levels else {},
+                "throttled_loggers": throttles.stats() if throttles else {},
+                "expiring_loggers": expirations.expiring() if expirations else {},
                 "last_updated": last_updated,
             }
+            return cleaned
 
         except Exception as e:
             _LOGGER.error(f"Error accessing logger data: {e}")
@@ -107,3 +213,28 @@ class LoggerInspectorSensor(SensorEntity):
                 "last_updated": None,
                 "available_attrs": [attr for attr in dir(data) if not attr.startswith('_')]
             }
+            return []
+
+
+class LogVolumeSensor(SensorEntity):
+    """Sensor that reports log records/sec and the noisiest loggers."""
+
+    _attr_name = "Noisiest Loggers"
+    _attr_icon = "mdi:chart-bar"
+    _attr_native_unit_of_measurement = "records/s"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_should_poll = True
+    # Polled every 30s; keep the top list out of the recorder
+    _unrecorded_attributes = frozenset({"top_loggers"})
+
+    def __init__(self, volume_handler: LogVolumeHandler) -> None:
+        """Initialize the sensor."""
+        self._volume_handler = volume_handler
+
+    async def async_update(self) -> None:
+        """Update the sensor state from the rolling counters."""
+        self._attr_native_value = self._volume_handler.total_rate()
+        self._attr_extra_state_attributes = {
+            "window_seconds": self._volume_handler.window,
+            "top_loggers": self._volume_handler.top(VOLUME_TOP_N),
+        }
@@ -0,0 +1,125 @@
+"""Per-logger rate limiting and sampling for Logger Manager."""
+from __future__ import annotations
+
+import logging
+
+
+class ThrottleFilter(logging.Filter):
+    """Drop records from one logger above a rate cap or outside a sample.
+
+    Sampling is deterministic: with ``sample_ratio`` 0.25 exactly one record
+    in four is kept. The rate cap is a token bucket refilled from each
+    record's creation time, allowing bursts of up to one second's worth of
+    records (at least one). Both can be combined; sampling is applied first.
+
+    Like any logger filter it only sees records created by that logger
+    itself, not records propagated from its children.
+    """
+
+    def __init__(self, rate_limit: float | None = None, sample_ratio: float | None = None) -> None:
+        """Initialize the filter."""
+        super().__init__()
+        self.rate_limit = rate_limit
+        self.sample_ratio = sample_ratio
+        self.passed = 0
+        self.dropped = 0
+        self._credit = 0.0
+        self._capacity = max(rate_limit or 0.0, 1.0)
+        self._tokens = self._capacity
+        self._last = 0.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be emitted."""
+        if self.sample_ratio is not None:
+            self._credit += self.sample_ratio
+            if self._credit < 1.0:
+                self.dropped += 1
+                return False
+            self._credit -= 1.0
+
+        if self.rate_limit is not None:
+            now = record.created
+            if self._last:
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self.rate_limit)
+            self._last = now
+            if self._tokens < 1.0:
+                self.dropped += 1
+                return False
+            self._tokens -= 1.0
+
+        self.passed += 1
+        return True
+
+    def as_dict(self) -> dict:
+        """Return the settings and counters of this filter."""
+        return {
+            "rate_limit": self.rate_limit,
+            "sample_ratio": self.sample_ratio,
+            "passed": self.passed,
+            "dropped": self.dropped,
+        }
+
+
+class ThrottleManager:
+    """Attach, replace and remove throttle filters on named loggers."""
+
+    def __init__(self) -> None:
+        """Initialize with no throttled loggers."""
+        self._filters: dict[str, ThrottleFilter] = {}
+
+    def __contains__(self, name: str) -> bool:
+        """Return True if the logger is throttled."""
+        return name in self._filters
+
+    def set(self, name: str, rate_limit: float | None, sample_ratio: float | None) -> bool:
+        """Throttle a logger; a rate of 0 or a ratio of 1 turns that part off.
+
+        Returns True if the logger is throttled afterwards.
+        """
+        if not rate_limit:
+            rate_limit = None
+        if sample_ratio is not None and sample_ratio >= 1:
+            sample_ratio = None
+
+        # Unchanged settings keep the filter, its counters and its token bucket
+        throttle = self._filters.get(name)
+        if throttle is not None and (throttle.rate_limit, throttle.sample_ratio) == (rate_limit, sample_ratio):
+            return True
+
+        self.remove(name)
+        if rate_limit is None and sample_ratio is None:
+            return False
+
+        throttle = ThrottleFilter(rate_limit, sample_ratio)
+        logging.getLogger(name).addFilter(throttle)
+        self._filters[name] = throttle
+        return True
+
+    def remove(self, name: str) -> None:
+        """Stop throttling a logger."""
+        throttle = self._filters.pop(name, None)
+        if throttle is not None:
+            logging.getLogger(name).removeFilter(throttle)
+
+    def clear(self) -> None:
+        """Stop throttling every logger."""
+        for name in list(self._filters):
+            self.remove(name)
+
+    def get(self, name: str) -> dict | None:
+        """Return the persisted settings of one logger, or None if it is not throttled."""
+        throttle = self._filters.get(name)
+        if throttle is None:
+            return None
+        return {"rate_limit": throttle.rate_limit, "sample_ratio": throttle.sample_ratio}
+
+    def settings(self) -> dict[str, dict]:
+        """Return the persisted settings of every throttled logger."""
+        return {
+            name: {"rate_limit": throttle.rate_limit, "sample_ratio": throttle.sample_ratio}
+            for name, throttle in sorted(self._filters.items())
+        }
+
+    def stats(self) -> dict[str, dict]:
+        """Return settings and passed/dropped counts for every throttled logger."""
+        return {name: throttle.as_dict() for name, throttle in sorted(self._filters.items())}
@@ -0,0 +1,96 @@
+"""Hierarchical logger tree index for Logger Manager."""
+from __future__ import annotations
+
+import logging
+
+ROOT = ""  # node name of the tree root
+
+
+def _level_name(level: int) -> str:
+    """Return the lowercase name of a numeric logging level."""
+    return logging.getLevelName(level).lower()
+
+
+def logger_levels(name: str) -> tuple[str | None, str]:
+    """Return (explicit, effective) level names for a logger name.
+
+    ``explicit`` is None when the logger does not exist or inherits (NOTSET).
+    Names without a real logger inherit from their nearest existing ancestor.
+    """
+    logger_dict = logging.Logger.manager.loggerDict
+    logger = logger_dict.get(name)
+    if isinstance(logger, logging.Logger):
+        explicit = _level_name(logger.level) if logger.level else None
+        return explicit, _level_name(logger.getEffectiveLevel())
+
+    parent = name
+    while parent:
+        parent = parent.rpartition(".")[0]
+        ancestor = logger_dict.get(parent) if parent else logging.getLogger()
+        if isinstance(ancestor, logging.Logger):
+            return None, _level_name(ancestor.getEffectiveLevel())
+    return None, _level_name(logging.getLogger().getEffectiveLevel())
+
+
+class LoggerTree:
+    """Dotted logger names arranged as a tree, served one level at a time.
+
+    Intermediate nodes that were not discovered themselves (for example
+    ``homeassistant.components`` when only its children matched) are still
+    created so every discovered name is reachable from the root.
+    """
+
+    def __init__(self, loggers: list[str]) -> None:
+        """Build the tree from a list of logger names."""
+        self._discovered = set(loggers)
+        self._children: dict[str, list[str]] = {ROOT: []}
+        self._descendants: dict[str, int] = {ROOT: 0}
+
+        for name in loggers:
+            parent = ROOT
+            node = ""
+            for segment in name.split("."):
+                node = f"{node}.{segment}" if node else segment
+                if node not in self._children:
+                    self._children[node] = []
+                    self._descendants[node] = 0
+                    self._children[parent].append(node)
+                parent = node
+            # Count the discovered name in every ancestor (not itself)
+            ancestor = name
+            while ancestor:
+                ancestor = ancestor.rpartition(".")[0]
+                self._descendants[ancestor] += 1
+
+        for children in self._children.values():
+            children.sort()
+
+    def __contains__(self, node: str) -> bool:
+        """Return True if the node exists in the tree."""
+        return node in self._children
+
+    def child_count(self, node: str) -> int:
+        """Return the number of direct children of a node."""
+        return len(self._children.get(node, ()))
+
+    def children(self, node: str = ROOT, offset: int = 0, limit: int | None = None) -> list[dict]:
+        """Return the direct children of a node with their counts and levels."""
+        names = self._children.get(node, [])
+        if limit is not None:
+            names = names[offset:offset + limit]
+        elif offset:
+            names = names[offset:]
+
+        result = []
+        for name in names:
+            explicit, effective = logger_levels(name)
+            result.append({
+                "name": name,
+                "label": name.rpartition(".")[2],
+                "children": len(self._children[name]),
+                "descendants": self._descendants[name],
+                "discovered": name in self._discovered,
+                "level": explicit,
+                "effective_level": effective,
+            })
+        return result
@@ -0,0 +1,107 @@
+"""Per-logger log volume counters for Logger Manager."""
+from __future__ import annotations
+
+import heapq
+import logging
+import time
+
+VOLUME_WINDOW = 60  # seconds covered by the rolling rate window
+VOLUME_TOP_N = 10
+_LEVEL_NAMES = ["notset", "debug", "info", "warning", "error", "critical"]
+
+
+class _LoggerVolume:
+    """Record counts for one logger: totals per level and a per-second ring."""
+
+    __slots__ = ("total", "levels", "buckets", "stamps")
+
+    def __init__(self, window: int) -> None:
+        """Initialize empty counters."""
+        self.total = 0
+        self.levels = [0] * len(_LEVEL_NAMES)
+        self.buckets = [0] * window
+        self.stamps = [0] * window
+
+    def rate(self, now: int, window: int) -> float:
+        """Return records/sec over the last window seconds."""
+        stamps = self.stamps
+        return sum(count for i, count in enumerate(self.buckets) if now - stamps[i] < window) / window
+
+
+class LogVolumeHandler(logging.Handler):
+    """Count every record that reaches the root logger, per logger and level.
+
+    ``handle`` is overridden so no lock is taken and nothing is formatted;
+    counting a record is a dict lookup and a few integer increments. Under
+    concurrent logging from several threads an occasional increment may be
+    lost, which is acceptable for rate statistics. Records from loggers with
+    ``propagate = False`` never reach the root logger and are not counted.
+
+    Loggers that logged nothing for a whole window are dropped from the
+    table (with their totals) when rates are read, so dynamically named
+    loggers do not accumulate for the whole uptime.
+    """
+
+    def __init__(self, window: int = VOLUME_WINDOW) -> None:
+        """Initialize the handler."""
+        super().__init__(logging.NOTSET)
+        self.window = window
+        self.since = time.time()
+        self._volumes: dict[str, _LoggerVolume] = {}
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Count the record."""
+        volume = self._volumes.get(record.name)
+        if volume is None:
+            volume = self._volumes[record.name] = _LoggerVolume(self.window)
+        volume.total += 1
+        volume.levels[min(record.levelno // 10, 5)] += 1
+
+        second = int(record.created)
+        idx = second % self.window
+        if volume.stamps[idx] != second:
+            volume.stamps[idx] = second
+            volume.buckets[idx] = 0
+        volume.buckets[idx] += 1
+        return True
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Count the record (handle() does all the work)."""
+        self.handle(record)
+
+    def _summary(self, name: str, volume: _LoggerVolume, rate: float) -> dict:
+        """Return the serializable summary for one logger."""
+        return {
+            "name": name,
+            "rate": round(rate, 3),
+            "total": volume.total,
+            "levels": {
+                level: count for level, count in zip(_LEVEL_NAMES, volume.levels) if count
+            },
+        }
+
+    def prune(self) -> int:
+        """Drop loggers idle for the whole window; returns how many were dropped."""
+        cutoff = int(time.time()) - self.window
+        idle = [name for name, volume in list(self._volumes.items()) if max(volume.stamps) <= cutoff]
+        for name in idle:
+            self._volumes.pop(name, None)
+        return len(idle)
+
+    def total_rate(self) -> float:
+        """Return the combined records/sec of all loggers, pruning idle ones first."""
+        self.prune()
+        now = int(time.time())
+        return round(sum(v.rate(now, self.window) for v in list(self._volumes.values())), 3)
+
+    def top(self, limit: int = VOLUME_TOP_N) -> list[dict]:
+        """Return the busiest loggers by records/sec over the rolling window."""
+        now = int(time.time())
+        rates = (
+            (volume.rate(now, self.window), volume.total, name, volume)
+            for name, volume in list(self._volumes.items())
+        )
+        return [
+            self._summary(name, volume, rate)
+            for rate, _, name, volume in heapq.nlargest(limit, rates, key=lambda item: item[:2])
+        ]
@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for Logger Manager's hot paths.
+
+Fills a private logging manager with synthetic loggers (1k/10k/100k by
+default) and drives the integration code against a minimal stand-in for
+``hass``. Needs the homeassistant package importable (a dev venv), but no
+running instance and no network.
+
+Usage:
+    python3 devtools/benchmark.py [--sizes 1000,10000] [--repeat 5]
+                                  [--output results.json]
+                                  [--baseline old.json [--threshold 1.25]]
+
+Results are written as JSON. With --baseline, benchmarks whose median is
+more than threshold times slower than the baseline are reported and the
+script exits with status 1.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from homeassistant.const import __version__ as HA_VERSION  # noqa: E402
+
+import custom_components.logger_manager as lm  # noqa: E402
+from custom_components.logger_manager.effective import EffectiveLevelCache  # noqa: E402
+from custom_components.logger_manager.journal import ChangeJournal  # noqa: E402
+from custom_components.logger_manager.levels import LevelApplier  # noqa: E402
+from custom_components.logger_manager.scheduler import ExpiryScheduler  # noqa: E402
+from custom_components.logger_manager.sensor import LoggerInspectorSensor  # noqa: E402
+from custom_components.logger_manager.throttle import ThrottleManager  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_REPEAT = 5
+APPLY_FRACTION = 10  # apply_levels is timed with 1/10th of all loggers (max APPLY_MAX)
+APPLY_MAX = 5_000
+
+# Share of synthetic names that the built-in patterns match
+_MATCHED_PREFIXES = ["homeassistant.components", "custom_components", "aiohttp", "urllib3", "asyncio"]
+_OTHER_PREFIXES = ["pkg", "vendor", "lib", "driver"]
+
+
+# --- hass stand-in ---------------------------------------------------------
+
+class FakeServices:
+    """Service registry that only knows logger.set_level."""
+
+    async def async_call(self, domain, service, data, blocking=False, **kwargs):
+        if (domain, service) != ("logger", "set_level"):
+            raise ValueError(f"Service {domain}.{service} not available in the benchmark")
+        # Set levels directly and clear the logger caches once per batch, so
+        # the benchmark measures this integration, not setLevel's per-call
+        # cache clearing across every logger
+        for name, level in data.items():
+            logging.getLogger(name).level = logging.getLevelName(level.upper())
+        logging.Logger.manager._clear_cache()
+
+
+class FakeBus:
+    """Event bus that accepts listeners but never fires them."""
+
+    def async_listen(self, event_type, listener):
+        return lambda: None
+
+    def async_fire(self, *args, **kwargs) -> None:
+        pass
+
+
+class FakeStore:
+    """Store that drops delayed saves; the benchmark measures the callers."""
+
+    def async_delay_save(self, data_func, delay=0) -> None:
+        pass
+
+    async def async_save(self, data) -> None:
+        pass
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for the integration's helpers."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.data = {}
+        self.services = FakeServices()
+        self.bus = FakeBus()
+
+    def async_create_task(self, coro, *args, **kwargs):
+        return self.loop.create_task(coro)
+
+    def async_create_background_task(self, coro, name, *args, **kwargs):
+        return self.loop.create_task(coro)
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+    def async_run_hass_job(self, job, *args, **kwargs):
+        result = job.target(*args)
+        if asyncio.iscoroutine(result):
+            return self.loop.create_task(result)
+        return result
+
+
+class FakeConnection:
+    """WebSocket connection that resolves a future with the first message."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.user = SimpleNamespace(is_admin=True)
+        self.response = loop.create_future()
+
+    def send_message(self, message) -> None:
+        if not self.response.done():
+            self.response.set_result(message)
+
+    def send_result(self, msg_id, result=None) -> None:
+        self.send_message({"id": msg_id, "result": result})
+
+    def send_error(self, msg_id, code, message) -> None:
+        self.send_message({"id": msg_id, "error": code})
+
+
+def _noop_logger_data() -> SimpleNamespace:
+    """Return a stand-in for hass.data["logger"] (HA's LoggerDomainConfig)."""
+    return SimpleNamespace(settings=SimpleNamespace(_default_level=logging.WARNING), overrides={})
+
+
+def _setup_hass(loop: asyncio.AbstractEventLoop, journal_path: str) -> FakeHass:
+    """Return a stand-in hass with hass.data populated like async_setup_entry."""
+    hass = FakeHass(loop)
+
+    async def _noop(due):
+        return None
+
+    hass.data["logger"] = _noop_logger_data()
+    hass.data[lm.DOMAIN] = {
+        "managed_loggers": {},
+        "last_updated": None,
+        "entry": SimpleNamespace(options={}, entry_id="bench"),
+        "level_applier": LevelApplier(hass, window=0),
+        "effective_levels": EffectiveLevelCache(),
+        "throttles": ThrottleManager(),
+        "expirations": ExpiryScheduler(hass, _noop),
+        "journal": ChangeJournal(hass, journal_path),
+        "store": FakeStore(),
+        "save_lock": asyncio.Lock(),
+    }
+    return hass
+
+
+# --- synthetic loggers -----------------------------------------------------
+
+def _synthetic_names(size: int, seed: int = 0) -> list[str]:
+    """Return size unique dotted logger names, roughly half matching the built-ins."""
+    rng = random.Random(seed)
+    names: list[str] = []
+    seen: set[str] = set()
+    while len(names) < size:
+        prefixes = _MATCHED_PREFIXES if rng.random() < 0.5 else _OTHER_PREFIXES
+        prefix = rng.choice(prefixes)
+        parts = [prefix, f"mod{rng.randrange(size // 10 + 1)}"]
+        for _ in range(rng.randrange(3)):
+            parts.append(f"sub{rng.randrange(20)}")
+        name = ".".join(parts)
+        if name not in seen:
+            seen.add(name)
+            names.append(name)
+    return names
+
+
+def _install_manager(names: list[str]) -> logging.Manager:
+    """Replace the global logging manager with one holding only names."""
+    manager = logging.Manager(logging.root)
+    logging.Logger.manager = manager
+    for name in names:
+        manager.getLogger(name)
+    return manager
+
+
+# --- timing ----------------------------------------------------------------
+
+def _summary(name: str, size: int, samples: list[float], **extra) -> dict:
+    """Return the JSON record for one benchmark."""
+    return {
+        "benchmark": name,
+        "size": size,
+        "repeat": len(samples),
+        "min_ms": round(min(samples) * 1000, 4),
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "mean_ms": round(statistics.fmean(samples) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+        **extra,
+    }
+
+
+def _time_sync(func, repeat: int) -> list[float]:
+    """Time a synchronous callable repeat times."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def _time_async(func, repeat: int, before=None) -> list[float]:
+    """Time an async callable repeat times; before() runs untimed each round."""
+    samples = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        await func()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def _bench_size(size: int, repeat: int) -> list[dict]:
+    """Run every benchmark against size synthetic loggers."""
+    loop = asyncio.get_running_loop()
+    names = _synthetic_names(size)
+    previous_manager = logging.Logger.manager
+    _install_manager(names)
+    tmp_dir = tempfile.TemporaryDirectory()
+    hass = _setup_hass(loop, str(Path(tmp_dir.name) / "journal.jsonl"))
+    managed_data = hass.data[lm.DOMAIN]
+    results: list[dict] = []
+
+    try:
+        # Pattern matching over the full name list
+        matcher = lm._get_matcher(hass)
+        samples = _time_sync(lambda: lm._effective_filtered_loggers(names, matcher), repeat)
+        matched = len(lm._effective_filtered_loggers(names, matcher))
+        results.append(_summary("effective_filtered_loggers", size, samples, matched=matched))
+
+        # Discovery from scratch (new index every round) and incremental (no change)
+        def _reset_index() -> None:
+            managed_data.pop(lm.INDEX_KEY, None)
+
+        samples = await _time_async(lambda: lm._discover_available_loggers(hass), repeat, _reset_index)
+        # Discovery yields between slices; the longest slice is the worst event-loop stall
+        block = lm._get_metrics(hass).as_dict()["timings"]["discovery_block"]
+        results.append(_summary(
+            "discover_available_loggers_full", size, samples, longest_block_ms=round(block["max_us"] / 1000, 4)
+        ))
+        samples = await _time_async(lambda: lm._discover_available_loggers(hass), repeat)
+        results.append(_summary("discover_available_loggers_incremental", size, samples))
+
+        # get_loggers WebSocket command: cache miss (rediscovery), hit and
+        # a hit for a client that already holds the current version
+        async def _get_loggers(version: int | None = None) -> None:
+            connection = FakeConnection(loop)
+            msg = {"id": 1, "type": "logger_manager/get_loggers"}
+            if version is not None:
+                msg["version"] = version
+            lm.websocket_get_loggers(hass, connection, msg)
+            response = await connection.response
+            if isinstance(response, dict) and "error" in response:
+                raise RuntimeError(f"get_loggers failed: {response}")
+
+        def _drop_cache() -> None:
+            managed_data.pop(lm.CACHE_KEY, None)
+            managed_data.pop(lm.INDEX_KEY, None)
+
+        samples = await _time_async(_get_loggers, repeat, _drop_cache)
+        results.append(_summary("websocket_get_loggers_miss", size, samples))
+        samples = await _time_async(_get_loggers, repeat)
+        results.append(_summary("websocket_get_loggers_hit", size, samples))
+        version = managed_data[lm.CACHE_KEY]["version"]
+        samples = await _time_async(lambda: _get_loggers(version), repeat)
+        results.append(_summary("websocket_get_loggers_not_modified", size, samples))
+
+        # apply_levels with a large logger list, alternating levels so every
+        # round changes every logger, then once more with nothing to change
+        targets = names[:min(size // APPLY_FRACTION, APPLY_MAX)]
+        levels = iter(["debug", "info"] * repeat)
+        samples = await _time_async(
+            lambda: lm._async_apply_levels(hass, dict.fromkeys(targets, next(levels))), repeat
+        )
+        results.append(_summary("apply_levels_changed", size, samples, loggers=len(targets)))
+        samples = await _time_async(lambda: lm._async_apply_levels(hass, dict.fromkeys(targets, "info")), repeat)
+        results.append(_summary("apply_levels_unchanged", size, samples, loggers=len(targets)))
+
+        # Full effective-level rebuild, sliced like discovery; the sensor
+        # itself only schedules it
+        effective_levels = managed_data["effective_levels"]
+        samples = await _time_async(effective_levels.async_refresh, repeat, effective_levels.invalidate)
+        results.append(_summary("effective_levels_rebuild", size, samples))
+
+        # Sensor state with every applied logger managed
+        sensor = LoggerInspectorSensor(hass)
+        samples = _time_sync(sensor._update_state, repeat)
+        results.append(_summary("sensor_update", size, samples, managed=len(managed_data["managed_loggers"])))
+    finally:
+        await managed_data["journal"].async_flush()
+        tmp_dir.cleanup()
+        logging.Logger.manager = previous_manager
+
+    return results
+
+
+def _compare(results: list[dict], baseline_path: Path, threshold: float) -> list[str]:
+    """Return a line per benchmark that regressed against the baseline file."""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {(r["benchmark"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["benchmark"], result["size"]))
+        if old and old["median_ms"] > 0 and result["median_ms"] > old["median_ms"] * threshold:
+            regressions.append(
+                f"{result['benchmark']}[{result['size']}]: "
+                f"{old['median_ms']} ms -> {result['median_ms']} ms "
+                f"({result['median_ms'] / old['median_ms']:.2f}x)"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated loggerDict sizes")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="rounds per benchmark")
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="previous JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="slowdown factor that counts as a regression (default 1.25)")
+    args = parser.parse_args()
+
+    # Keep the integration's debug output out of the measurements
+    logging.getLogger("custom_components.logger_manager").setLevel(logging.WARNING)
+
+    manifest = json.loads((ROOT_DIR / "custom_components/logger_manager/manifest.json").read_text())
+    results: list[dict] = []
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        print(f"Benchmarking {size} loggers...", file=sys.stderr)
+        results.extend(asyncio.run(_bench_size(size, args.repeat)))
+
+    report = {
+        "meta": {
+            "integration_version": manifest.get("version"),
+            "homeassistant_version": HA_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+        print(f"Wrote {len(results)} results to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.baseline:
+        regressions = _compare(results, args.baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())